@@ -0,0 +1,397 @@
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import tempfile
+import time
+import timeit
+
+from even_glasses import codec
+from even_glasses.bluetooth_manager import Glass, GlassesManager
+from even_glasses.decoders import decode
+from even_glasses.notification_handlers import handle_incoming_notification
+from even_glasses.commands import send_image, send_text, stream_text
+from even_glasses.page_index import PageIndex
+from even_glasses.packet_cache import text_packet_cache
+from even_glasses.models import (
+    Command,
+    NCSNotification,
+    NoteAdd,
+    Notification,
+    ResponseStatus,
+    SendResult,
+    SubCommand,
+)
+from even_glasses.packet_log import RX
+from even_glasses.transport import LoopbackTransport
+
+logging.basicConfig(level=logging.ERROR, force=True)
+logger = logging.getLogger(__name__)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Even Glasses send path benchmarks over the loopback transport"
+    )
+
+    benchmark = parser.add_mutually_exclusive_group(required=True)
+    benchmark.add_argument("--send", action="store_true", help="Raw BleDevice.send throughput")
+    benchmark.add_argument("--image", action="store_true", help="send_image to both arms")
+    benchmark.add_argument("--text", action="store_true", help="send_text to both arms")
+    benchmark.add_argument(
+        "--stream", action="store_true", help="stream_text of simulated model tokens"
+    )
+    benchmark.add_argument(
+        "--codec", action="store_true", help="Per-packet encode cost, models against the codec"
+    )
+    benchmark.add_argument(
+        "--replay", action="store_true", help="Inbound packets/s through the notification dispatcher"
+    )
+    benchmark.add_argument(
+        "--page-index", action="store_true", help="Page index build time and page seek latency"
+    )
+
+    # Loopback link parameters
+    parser.add_argument(
+        "--latency", type=float, default=0.0075, help="Per-write latency in seconds (default: 0.0075)"
+    )
+    parser.add_argument("--mtu", type=int, default=247, help="Negotiated ATT MTU (default: 247)")
+    parser.add_argument(
+        "--drop-rate", type=float, default=0.0, help="Fraction of writes lost (default: 0)"
+    )
+    parser.add_argument(
+        "--packets", type=int, default=200, help="Packets for --send (default: 200)"
+    )
+    parser.add_argument(
+        "--image-file", type=str, default="image_1.bmp", help="BMP for --image (default: image_1.bmp)"
+    )
+    parser.add_argument(
+        "--pipelined",
+        action="store_true",
+        help="Send bulk packets without response through the write window",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Runs per benchmark, best is reported (default: 3)"
+    )
+    parser.add_argument(
+        "--document",
+        type=str,
+        default=None,
+        help="UTF-8 document for --page-index (default: a generated 10 MB script)",
+    )
+    parser.add_argument(
+        "--seeks", type=int, default=1000, help="Random page seeks for --page-index (default: 1000)"
+    )
+
+    parser.add_argument(
+        "--tokens-per-second",
+        type=float,
+        default=40.0,
+        help="Token rate of the simulated model for --stream (default: 40)",
+    )
+    parser.add_argument(
+        "--max-rate", type=float, default=10.0, help="Updates per second for --stream (default: 10)"
+    )
+
+    parser.add_argument(
+        "--capture",
+        type=str,
+        default=None,
+        help="packet_log.dump() JSON replayed by --replay (default: a synthetic mic-heavy mix)",
+    )
+
+    return parser.parse_args()
+
+
+async def loopback_manager(args) -> GlassesManager:
+    """Create a manager whose arms are connected through loopback transports."""
+    manager = GlassesManager(
+        left_address="loopback-L",
+        right_address="loopback-R",
+        transport_factory=lambda address: LoopbackTransport(
+            address=address,
+            latency=args.latency,
+            mtu=args.mtu,
+            drop_rate=args.drop_rate,
+            seed=0,
+        ),
+        pipelined=args.pipelined,
+    )
+    await asyncio.gather(manager.left_glass.connect(), manager.right_glass.connect())
+    return manager
+
+
+def report(name: str, elapsed: float, packets: int, payload_bytes: int):
+    print(
+        f"{name}: {packets} packets, {payload_bytes} bytes in {elapsed * 1000:.1f} ms "
+        f"({packets / elapsed:.0f} packets/s, {payload_bytes / elapsed / 1024:.1f} KiB/s)"
+    )
+
+
+async def bench_send(manager: GlassesManager, args) -> float:
+    packet = bytes(range(194))
+    start = time.perf_counter()
+    for _ in range(args.packets):
+        await manager.left_glass.send(packet, bulk=True)
+    await manager.left_glass.drain()
+    return time.perf_counter() - start
+
+
+async def bench_image(manager: GlassesManager, image_data: bytes) -> float:
+    start = time.perf_counter()
+    await send_image(manager, image_data)
+    return time.perf_counter() - start
+
+
+async def bench_text(manager: GlassesManager, text: str) -> float:
+    start = time.perf_counter()
+    await send_text(manager, text, duration=0)
+    return time.perf_counter() - start
+
+
+async def simulated_tokens(text: str, tokens_per_second: float):
+    """Words of ``text`` with their leading space, like a language model streams them."""
+    for index, word in enumerate(text.split(" ")):
+        await asyncio.sleep(1 / tokens_per_second)
+        yield word if index == 0 else " " + word
+
+
+async def bench_stream(manager: GlassesManager, args):
+    text = "The quick brown fox jumps over the lazy dog. " * 24
+    stream = await stream_text(
+        manager,
+        simulated_tokens(text.strip(), args.tokens_per_second),
+        max_rate=args.max_rate,
+        delay=0,
+    )
+    print(
+        f"stream: {stream.tokens} tokens in {stream.updates} updates over {stream.pages} pages, "
+        f"first glyph after {stream.time_to_first_glyph * 1000:.1f} ms"
+    )
+    print(
+        f"  {stream.bytes_on_air} bytes on air, {stream.bytes_per_token:.1f} bytes per token"
+    )
+
+
+def written(manager: GlassesManager):
+    """Packets and bytes that reached both loopback arms."""
+    received = manager.left_glass.transport.received + manager.right_glass.transport.received
+    return len(received), sum(len(packet) for packet in received)
+
+
+def bench_codec(args):
+    page = ("The quick brown fox jumps over the lazy dog. " * 5)[:220].encode("utf-8")
+    buffer = bytearray(512)
+    ncs_notification = NCSNotification(
+        msg_id=1,
+        app_identifier="org.telegram.messenger",
+        title="Message",
+        subtitle="",
+        message="The quick brown fox jumps over the lazy dog. " * 8,
+        display_name="Telegram",
+    )
+    notification = Notification(ncs_notification=ncs_notification, type="Add")
+
+    def complete(coroutine):
+        # construct_notification never awaits, so one step runs it to the end
+        try:
+            coroutine.send(None)
+        except StopIteration as done:
+            return done.value
+    cases = [
+        (
+            "SendResult page",
+            lambda: SendResult(
+                seq=1, total_packages=1, current_package=0, screen_status=0x30,
+                page_number=2, max_pages=5, data=page,
+            ).build(),
+            lambda: codec.encode_send_result(page, 1, 1, 0, 0x30, 0, 2, 5),
+            lambda: codec.pack_send_result_into(buffer, 0, page, 1, 1, 0, 0x30, 0, 2, 5),
+        ),
+        (
+            "NoteAdd",
+            lambda: NoteAdd(note_number=1, name="Groceries", text="Milk, eggs, bread").build(),
+            lambda: codec.encode_note_add(1, "Groceries", "Milk, eggs, bread", 0),
+            None,
+        ),
+        (
+            "Notification chunks",
+            lambda: complete(notification.construct_notification(176)),
+            lambda: codec.encode_notification_chunks(
+                codec.encode_notification_json(ncs_notification), 176
+            ),
+            None,
+        ),
+        (
+            "Heartbeat",
+            None,
+            lambda: codec.encode_heartbeat(7),
+            lambda: codec.pack_heartbeat_into(buffer, 0, 7),
+        ),
+    ]
+    number = args.packets * 50
+    for name, model, encode, pack_into in cases:
+        timings = []
+        for label, encoder in (("model", model), ("codec", encode), ("pack_into", pack_into)):
+            if encoder is None:
+                continue
+            best = min(timeit.repeat(encoder, number=number, repeat=args.repeat)) / number
+            timings.append(f"{label} {best * 1e6:.2f} us")
+        print(f"{name}: " + ", ".join(timings))
+
+
+def synthetic_capture():
+    """Inbound traffic of a session with the mic open: mostly audio, some acks and events."""
+    packets = []
+    for seq in range(1000):
+        packets.append(bytes([Command.RECEIVE_MIC_DATA, seq & 0xFF]) + bytes(200))
+        if seq % 10 == 0:
+            packets.append(bytes([Command.SEND_RESULT, ResponseStatus.SUCCESS]))
+        if seq % 50 == 0:
+            packets.append(bytes([Command.HEARTBEAT, 6, 0, seq & 0xFF, 0x04, seq & 0xFF]))
+        if seq % 100 == 0:
+            packets.append(bytes([Command.START_AI, SubCommand.PAGE_CONTROL]))
+    return packets
+
+
+async def bench_replay(args):
+    if args.capture:
+        with open(args.capture) as f:
+            packets = [
+                bytes.fromhex(record["data"]) for record in json.load(f) if record["direction"] == RX
+            ]
+    else:
+        packets = synthetic_capture()
+    # Notifications arrive from bleak as bytearrays
+    packets = [bytearray(packet) for packet in packets]
+    glass = Glass("G1 Replay", "replay", "right", transport=LoopbackTransport("replay"))
+    number = max(1, args.packets * 50 // len(packets))
+
+    def decode_all():
+        for packet in packets:
+            decode(packet)
+
+    decode_time = min(timeit.repeat(decode_all, number=number, repeat=args.repeat))
+    dispatch_time = None
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            for packet in packets:
+                await handle_incoming_notification(glass, 0, packet)
+        elapsed = time.perf_counter() - start
+        dispatch_time = elapsed if dispatch_time is None else min(dispatch_time, elapsed)
+
+    total = len(packets) * number
+    print(f"replay: {len(packets)} packets x {number}")
+    print(f"  decode: {total / decode_time:,.0f} packets/s")
+    print(f"  dispatch to handlers: {total / dispatch_time:,.0f} packets/s")
+
+
+def bench_page_index(args):
+    with tempfile.TemporaryDirectory() as directory:
+        document = args.document
+        if document is None:
+            document = os.path.join(directory, "script.txt")
+            paragraph = "The quick brown fox jumps over the lazy dog. " * 12 + "\n\n"
+            with open(document, "w", encoding="utf-8") as f:
+                f.write(paragraph * (10 * 1024 * 1024 // len(paragraph)))
+        index_dir = os.path.join(directory, "index")
+        size = os.path.getsize(document)
+
+        start = time.perf_counter()
+        index = PageIndex(document, index_dir=index_dir)
+        build = time.perf_counter() - start
+        index.close()
+
+        start = time.perf_counter()
+        index = PageIndex(document, index_dir=index_dir)
+        reopen = time.perf_counter() - start
+
+        pages = random.Random(0).choices(range(1, len(index) + 1), k=args.seeks)
+        latencies = []
+        for page_number in pages:
+            start = time.perf_counter()
+            index.page(page_number)
+            latencies.append(time.perf_counter() - start)
+        index.close()
+
+    latencies.sort()
+    print(
+        f"page index: {size / 1024 / 1024:.1f} MB, {len(index)} pages, "
+        f"built in {build * 1000:.0f} ms, reopened in {reopen * 1000:.1f} ms"
+    )
+    print(
+        f"  seek: median {latencies[len(latencies) // 2] * 1e6:.0f} us, "
+        f"p99 {latencies[int(len(latencies) * 0.99)] * 1e6:.0f} us over {args.seeks} pages"
+    )
+
+
+async def main():
+    args = parse_args()
+    if args.page_index:
+        bench_page_index(args)
+        return
+    if args.codec:
+        bench_codec(args)
+        return
+    if args.replay:
+        await bench_replay(args)
+        return
+    manager = await loopback_manager(args)
+    if args.stream:
+        try:
+            await bench_stream(manager, args)
+        finally:
+            await manager.disconnect_all()
+        return
+
+    image_data = b""
+    if args.image:
+        with open(args.image_file, "rb") as f:
+            image_data = f.read()
+        # Warm up so first-use costs are not measured
+        await bench_image(manager, image_data)
+
+    text = "The quick brown fox jumps over the lazy dog. " * 8
+
+    try:
+        best = None
+        for _ in range(args.repeat):
+            for glass in (manager.left_glass, manager.right_glass):
+                glass.transport.received.clear()
+                glass.throughput.reset()
+            if args.send:
+                elapsed = await bench_send(manager, args)
+            elif args.image:
+                elapsed = await bench_image(manager, image_data)
+            else:
+                elapsed = await bench_text(manager, text)
+            if best is None or elapsed < best:
+                best = elapsed
+        name = "send" if args.send else "image" if args.image else "text"
+        report(name, best, *written(manager))
+        for glass in (manager.left_glass, manager.right_glass):
+            throughput = glass.throughput
+            print(
+                f"  {glass.side}: {throughput.packets_sent} packets sent, "
+                f"{throughput.bytes_per_second / 1024:.1f} KiB/s"
+            )
+        if args.text:
+            cache = text_packet_cache.snapshot()
+            print(
+                f"  packet cache: {cache['hits']} hits, {cache['misses']} misses, "
+                f"{cache['bytes']} bytes"
+            )
+        if manager.last_dispatch and manager.last_dispatch.skew is not None:
+            print(
+                f"  {manager.last_dispatch.policy.name} left/right skew: "
+                f"{manager.last_dispatch.skew * 1000:.1f} ms"
+            )
+    finally:
+        await manager.disconnect_all()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -2,6 +2,8 @@ from even_glasses.bluetooth_manager import (
     Glass,
     GlassesManager
 )
+from even_glasses.registry import DeviceRegistry
+from even_glasses.fleet import FleetManager
 
 from even_glasses.models import (
     ScreenAction,
@@ -15,6 +17,8 @@ __version__ = "0.1.11"
 __all__ = [
     "Glass",
     "GlassesManager",
+    "DeviceRegistry",
+    "FleetManager",
     "Command",
     "ScreenAction",
     "Notification",
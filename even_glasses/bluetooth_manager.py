@@ -1,132 +1,426 @@
 import asyncio
 import logging
-from bleak import BleakClient, BleakScanner
-from bleak.exc import BleakError
-from typing import Optional, Callable
-from even_glasses.models import DesiredConnectionState
-
-from even_glasses.utils import construct_heartbeat
-from even_glasses.service_identifiers import (
-    UART_SERVICE_UUID,
-    UART_TX_CHAR_UUID,
-    UART_RX_CHAR_UUID,
+import time
+from bleak import BleakScanner
+from collections import deque
+from typing import Optional, Awaitable, Callable, Deque, Dict, Iterable, List, Set, Tuple, Union
+from even_glasses.models import (
+    Command,
+    DesiredConnectionState,
+    DispatchPolicy,
+    DispatchResult,
+    OverflowPolicy,
+    SendPriority,
+    ScanResult,
+    ReconnectPolicy,
 )
 
-logging.basicConfig(level=logging.INFO)
+from even_glasses.utils import (
+    construct_heartbeat,
+    reply_sequence,
+    is_failure_reply,
+    packet_budget,
+    ATT_WRITE_OVERHEAD,
+)
+from even_glasses.transport import Transport, BleakTransport, TransportError
+from even_glasses.service_identifiers import UART_SERVICE_UUID
+from even_glasses.registry import DeviceRegistry
+from even_glasses.flow_control import WriteWindow, window_for_mtu
+from even_glasses.metrics import ThroughputCounter, RecoveryStats, LinkQuality, SendMetrics, SendHook
+from even_glasses.scheduler import PriorityWriteLock, priority_for
+from even_glasses.packet_log import packet_log, TX, RX
+from even_glasses.inbound_queue import InboundQueue
+from even_glasses.events import EventHub, EventSubscription, EventFilter
+
 logger = logging.getLogger(__name__)
 
 
 class BleDevice:
     """Base class for BLE device communication."""
 
-    def __init__(self, name: str, address: str):
+    def __init__(
+        self,
+        name: str,
+        address: str,
+        transport: Optional[Transport] = None,
+        pipelined: bool = False,
+    ):
         self.name = name
         self.address = address
-        self.client = BleakClient(
-            address,
-            disconnected_callback=self._handle_disconnection,
-        )
-        self.uart_tx = None
-        self.uart_rx = None
-        self._write_lock = asyncio.Lock()
+        self.transport = transport or BleakTransport(address)
+        self.transport.set_disconnected_callback(self._handle_disconnection)
+        # Serializes writes, serving heartbeats and control commands before bulk data
+        self.scheduler = PriorityWriteLock()
+        # Bulk sends use write-without-response with a window of writes in flight
+        self.pipelined = pipelined
+        self.throughput = ThroughputCounter()
+        # Lock wait, write and acknowledgment histograms, plus observers of each send
+        self.send_metrics = SendMetrics()
+        self.send_hooks: List[SendHook] = []
+        self._window: Optional[WriteWindow] = None
+        self._in_flight: Set[asyncio.Task] = set()
+        self._pipeline_failed = False
         self.notifications_started = False
         self.desired_connection_state = DesiredConnectionState.DISCONNECTED
+        self.reconnect_policy = ReconnectPolicy()
+        self.recovery = RecoveryStats()
+        self._reconnect_task: Optional[asyncio.Task] = None
+        # Shared by devices whose connection attempts must not overlap, e.g. a fleet
+        self.connect_slots: Optional[asyncio.Semaphore] = None
+        # Seconds a connection attempt may take once it holds a slot
+        self.connect_timeout: Optional[float] = None
+
+    @property
+    def client(self) -> Transport:
+        """Transport of the device, kept under its historical name."""
+        return self.transport
+
+    @property
+    def is_connected(self) -> bool:
+        return self.transport.is_connected
+
+    @property
+    def mtu_size(self) -> int:
+        return self.transport.mtu_size
 
     async def connect(self):
         logger.info(f"Connecting to {self.name} ({self.address})")
+        self.desired_connection_state = DesiredConnectionState.CONNECTED
         try:
-            await self.client.connect()
+            if self.connect_slots:
+                # The deadline starts once the slot is ours, not while waiting for it
+                async with self.connect_slots:
+                    await asyncio.wait_for(self.transport.connect(), self.connect_timeout)
+            else:
+                await asyncio.wait_for(self.transport.connect(), self.connect_timeout)
             logger.info(f"Connected to {self.name}")
-
-            # Discover services
-            await self.client.get_services()
-            services = self.client.services
-
-            uart_service = services.get_service(UART_SERVICE_UUID)
-            if not uart_service:
-                raise BleakError(f"UART service not found for {self.name}")
-
-            self.uart_tx = uart_service.get_characteristic(UART_TX_CHAR_UUID)
-            self.uart_rx = uart_service.get_characteristic(UART_RX_CHAR_UUID)
-
-            if not self.uart_tx or not self.uart_rx:
-                raise BleakError(f"UART TX/RX characteristics not found for {self.name}")
-
+            # The MTU may differ from the previous connection
+            self._window = None
             await self.start_notifications()
         except Exception as e:
             logger.error(f"Error connecting to {self.name}: {e}")
-            await self.disconnect()
+            await self._close()
             raise
 
     async def disconnect(self):
         """Gracefully disconnect from the BLE device, stopping notifications if they are active."""
+        self.desired_connection_state = DesiredConnectionState.DISCONNECTED
+        task = self._reconnect_task
+        if task and not task.done() and task is not asyncio.current_task():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await self._close()
+
+    async def _close(self):
         try:
-            # Check if notifications are started and `uart_rx` exists before stopping them
-            if self.notifications_started and self.uart_rx:
+            if self.notifications_started:
                 try:
-                    await self.client.stop_notify(self.uart_rx)
+                    await self.transport.stop_notify()
                     logger.info(f"Stopped notifications for {self.name}")
                 except Exception as e:
                     logger.warning(f"Failed to stop notifications for {self.name}: {e}")
                 finally:
                     self.notifications_started = False
 
-            # Check if the client is still connected before attempting to disconnect
-            if self.client.is_connected:
-                await self.client.disconnect()
+            # Check if the transport is still connected before attempting to disconnect
+            if self.transport.is_connected:
+                await self.transport.disconnect()
                 logger.info(f"Disconnected from {self.name}")
         except Exception as e:
             logger.error(f"Error during disconnection for {self.name}: {e}")
 
-    def _handle_disconnection(self, client: BleakClient):
+    def _handle_disconnection(self, transport: Transport):
         logger.warning(f"Device {self.name} disconnected")
+        # The subscription died with the link
+        self.notifications_started = False
         if self.desired_connection_state == DesiredConnectionState.CONNECTED:
-            asyncio.create_task(self.reconnect())
-
-    async def reconnect(self):
-        retries = 3
-        for attempt in range(1, retries + 1):
+            self.start_reconnect()
+
+    def start_reconnect(self) -> asyncio.Task:
+        """Start the reconnect supervisor unless it is already running."""
+        if self._reconnect_task is None or self._reconnect_task.done():
+            self._reconnect_task = asyncio.create_task(self.reconnect())
+        return self._reconnect_task
+
+    async def reconnect(self) -> bool:
+        """Reconnect with exponential backoff and jitter until connected or out of attempts."""
+        policy = self.reconnect_policy
+        started_at = time.perf_counter()
+        for attempt in range(1, policy.max_attempts + 1):
+            if self.desired_connection_state != DesiredConnectionState.CONNECTED:
+                return False
             try:
-                logger.info(f"Reconnecting to {self.name} (Attempt {attempt}/{retries})")
+                logger.info(
+                    f"Reconnecting to {self.name} (Attempt {attempt}/{policy.max_attempts})"
+                )
                 await self.connect()
-                logger.info(f"Reconnected to {self.name}")
-                return
+                time_to_recover = time.perf_counter() - started_at
+                self.recovery.record(time_to_recover)
+                logger.info(f"Reconnected to {self.name} in {time_to_recover:.2f}s")
+                return True
             except Exception as e:
                 logger.error(f"Reconnection attempt {attempt} failed: {e}")
-                await asyncio.sleep(5)
-        logger.error(f"Failed to reconnect to {self.name} after {retries} attempts")
+                if attempt < policy.max_attempts:
+                    await asyncio.sleep(policy.delay(attempt))
+        self.recovery.record_failure()
+        logger.error(f"Failed to reconnect to {self.name} after {policy.max_attempts} attempts")
+        return False
 
     async def start_notifications(self):
-        if not self.notifications_started and self.uart_rx:
+        if not self.notifications_started:
             try:
-                await self.client.start_notify(self.uart_rx, self.handle_notification)
+                await self.transport.start_notify(self.handle_notification)
                 self.notifications_started = True
                 logger.info(f"Notifications started for {self.name}")
             except Exception as e:
                 logger.error(f"Failed to start notifications for {self.name}: {e}")
 
-    async def send(self, data: bytes) -> bool:
-        if not self.client.is_connected:
+    def packet_budget(self, header: int, maximum: int) -> int:
+        """Payload bytes per packet fitting this device's negotiated MTU."""
+        return packet_budget(self.mtu_size if self.is_connected else None, header, maximum)
+
+    @property
+    def write_window(self) -> WriteWindow:
+        if self._window is None:
+            self._window = WriteWindow(window_for_mtu(self.mtu_size))
+        return self._window
+
+    async def send(
+        self,
+        data: bytes,
+        bulk: bool = False,
+        priority: Optional[SendPriority] = None,
+    ) -> bool:
+        """Send a packet, pipelining it without response if ``bulk`` and pipelined mode is on.
+
+        Packets wait for the link in ``priority`` order, inferred from the
+        command byte when not given. Pipelined packets are issued in order but
+        may still be in flight on return; ``drain`` waits for them and reports
+        whether any failed.
+        """
+        if self.send_hooks:
+            self._call_hooks("on_send_start", data)
+        if not self.transport.is_connected:
             logger.warning(f"Cannot send data, {self.name} is disconnected.")
+            self._record_failure(data, TransportError(f"{self.name} is disconnected"))
             return False
 
-        if not self.uart_tx:
-            logger.warning(f"No TX characteristic available for {self.name}.")
-            return False
+        if priority is None:
+            priority = priority_for(data, bulk)
+        command = data[0] if data else None
+
+        # Packets over the MTU need a long write, which only exists with response
+        if self.pipelined and bulk and len(data) <= self.mtu_size - ATT_WRITE_OVERHEAD:
+            queued_at = time.perf_counter()
+            async with self.scheduler.hold(priority):
+                lock_wait = time.perf_counter() - queued_at
+                self.send_metrics.record(command, "lock_wait", lock_wait)
+                window = self.write_window
+                await window.acquire()
+                task = asyncio.create_task(self._write_pipelined(data, window, lock_wait))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+            return True
 
         try:
-            async with self._write_lock:
-                await self.client.write_gatt_char(self.uart_tx, data, response=True)
-            logger.info(f"Data sent to {self.name}: {data.hex()}")
+            queued_at = time.perf_counter()
+            async with self.scheduler.hold(priority):
+                lock_wait = time.perf_counter() - queued_at
+                self.send_metrics.record(command, "lock_wait", lock_wait)
+                # Keep ordering behind pipelined writes still in flight
+                await self._wait_in_flight()
+                started_at = time.perf_counter()
+                await self.transport.write(data, response=True)
+            self._record_sent(data, started_at, lock_wait)
             return True
         except Exception as e:
             logger.error(f"Error sending data to {self.name}: {e}")
+            self._record_failure(data, e)
+            return False
+
+    async def send_many(
+        self,
+        packets: Iterable,
+        bulk: bool = True,
+        priority: Optional[SendPriority] = None,
+    ) -> int:
+        """Send packets back to back, taking the write lock once for the whole batch.
+
+        Packets may be any buffer, e.g. NumPy arrays. The lock is only given up
+        at a packet boundary when a more urgent class is waiting for it.
+        Returns how many leading packets were delivered, fewer than given when
+        the batch failed midway.
+        """
+        if not self.transport.is_connected:
+            logger.warning(f"Cannot send data, {self.name} is disconnected.")
+            self.send_metrics.failures += 1
+            return 0
+
+        packets = iter(packets)
+        first = next(packets, None)
+        if first is None:
+            return 0
+        first = _packet_bytes(first)
+        if priority is None:
+            priority = priority_for(first, bulk)
+
+        pipelined = self.pipelined and bulk
+        limit = self.mtu_size - ATT_WRITE_OVERHEAD
+        # True for packets written with response, the write task otherwise
+        outcomes: List[Union[bool, asyncio.Task]] = []
+        queued_at = time.perf_counter()
+        await self.scheduler.acquire(priority)
+        owned = True
+        # Charged to the packet that waited for the lock
+        lock_wait = time.perf_counter() - queued_at
+        self.send_metrics.record(first[0] if first else None, "lock_wait", lock_wait)
+        # Failures of this batch's own writes; ``drain`` keeps reporting all of them
+        batch_failed = False
+
+        def note_outcome(task: asyncio.Task):
+            nonlocal batch_failed
+            if task.cancelled() or not task.result():
+                batch_failed = True
+
+        try:
+            # Keep ordering behind earlier pipelined writes
+            await self._wait_in_flight()
+            data = first
+            while data is not None:
+                command = data[0] if data else None
+                if outcomes and self.scheduler.urgent_waiting(priority):
+                    owned = False
+                    self.scheduler.release()
+                    queued_at = time.perf_counter()
+                    await self.scheduler.acquire(priority)
+                    owned = True
+                    lock_wait = time.perf_counter() - queued_at
+                    self.send_metrics.record(command, "lock_wait", lock_wait)
+                if self.send_hooks:
+                    self._call_hooks("on_send_start", data)
+
+                if pipelined and len(data) <= limit:
+                    if batch_failed:
+                        break
+                    window = self.write_window
+                    await window.acquire()
+                    task = asyncio.create_task(self._write_pipelined(data, window, lock_wait))
+                    self._in_flight.add(task)
+                    task.add_done_callback(self._in_flight.discard)
+                    task.add_done_callback(note_outcome)
+                    outcomes.append(task)
+                else:
+                    await self._wait_in_flight()
+                    if batch_failed:
+                        break
+                    started_at = time.perf_counter()
+                    try:
+                        await self.transport.write(data, response=True)
+                    except Exception as e:
+                        logger.error(f"Error sending data to {self.name}: {e}")
+                        self._record_failure(data, e)
+                        break
+                    self._record_sent(data, started_at, lock_wait)
+                    outcomes.append(True)
+                lock_wait = 0.0
+
+                data = next(packets, None)
+                if data is not None:
+                    data = _packet_bytes(data)
+        finally:
+            if owned:
+                self.scheduler.release()
+
+        tasks = [outcome for outcome in outcomes if outcome is not True]
+        if tasks:
+            await asyncio.gather(*tasks)
+        sent = 0
+        for outcome in outcomes:
+            if outcome is not True and not outcome.result():
+                break
+            sent += 1
+        if data is None and sent == len(outcomes):
+            logger.info(f"Sent {sent} packets to {self.name}")
+        else:
+            logger.error(f"Batch to {self.name} stopped after {sent} packets")
+        return sent
+
+    async def _write_pipelined(self, data: bytes, window: WriteWindow, lock_wait: float = 0.0) -> bool:
+        started_at = time.perf_counter()
+        try:
+            await self.transport.write(data, response=False)
+        except Exception as e:
+            self._pipeline_failed = True
+            window.release(success=False)
+            logger.error(f"Error sending data to {self.name}: {e}")
+            self._record_failure(data, e)
             return False
+        window.release(success=True)
+        self._record_sent(data, started_at, lock_wait)
+        return True
+
+    def _record_sent(self, data: bytes, started_at: float, lock_wait: float):
+        """Account a completed write in throughput, metrics, packet log and hooks."""
+        duration = time.perf_counter() - started_at
+        self.throughput.record(len(data), started_at)
+        self.send_metrics.record_write(data[0] if data else None, len(data), duration)
+        if packet_log.enabled:
+            packet_log.record(self.name, TX, data)
+        if self.send_hooks:
+            self._call_hooks("on_send_finish", data, lock_wait, duration)
+
+    def _record_failure(self, data: bytes, error: Exception):
+        self.send_metrics.failures += 1
+        if self.send_hooks:
+            self._call_hooks("on_send_fail", data, error)
+
+    def _call_hooks(self, callback: str, *args):
+        for hook in self.send_hooks:
+            try:
+                getattr(hook, callback)(self, *args)
+            except Exception as e:
+                logger.warning(f"Send hook {type(hook).__name__}.{callback} failed: {e}")
+
+    def add_send_hook(self, hook: SendHook):
+        self.send_hooks.append(hook)
+
+    def remove_send_hook(self, hook: SendHook):
+        if hook in self.send_hooks:
+            self.send_hooks.remove(hook)
+
+    def metrics_snapshot(self) -> Dict:
+        """Link counters and send histograms of this device, cheap enough to poll."""
+        return {
+            "connected": self.is_connected,
+            "throughput": self.throughput.snapshot(),
+            "send": self.send_metrics.snapshot(),
+            "scheduler": self.scheduler.snapshot(),
+            "recovery": self.recovery.snapshot(),
+        }
+
+    async def _wait_in_flight(self):
+        """Wait for pipelined writes in flight, leaving their failures for ``drain`` to report."""
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight)
+
+    async def drain(self) -> bool:
+        """Wait for pipelined writes in flight; False if any failed since the last drain."""
+        await self._wait_in_flight()
+        failed, self._pipeline_failed = self._pipeline_failed, False
+        return not failed
 
     async def handle_notification(self, sender: int, data: bytes):
         ...
 
 
+def _packet_bytes(packet) -> bytes:
+    """Packet as bytes, copying only buffers of other types."""
+    return packet if isinstance(packet, bytes) else memoryview(packet).tobytes()
+
+
 class Glass(BleDevice):
     """Class representing a single glass device."""
 
@@ -136,23 +430,52 @@ class Glass(BleDevice):
         address: str,
         side: str,
         heartbeat_freq: int = 5,
+        transport: Optional[Transport] = None,
+        pipelined: bool = False,
     ):
-        super().__init__(name, address)
+        super().__init__(name, address, transport, pipelined)
         self.side = side
         self.heartbeat_freq = heartbeat_freq
         self.heartbeat_task: Optional[asyncio.Task] = None
         self.notification_handler: Optional[Callable[[int, bytes], None]] = None
-        
+        # Packets wait here for notification_handler, so a slow handler does
+        # not hold up the notify callback, acknowledgments or later packets
+        self.inbound = InboundQueue(self._deliver_notification, name=name)
+        # Subscriptions of events(), fed straight from the notify callback
+        self.event_hub = EventHub(side)
+        # Replies awaited by request(), per command byte in send order
+        self._pending_replies: Dict[int, Deque[Tuple[Optional[int], asyncio.Future]]] = {}
+        # Heartbeat round trips and losses, the live link-quality signal of this arm
+        self.link_quality = LinkQuality()
+        self._heartbeat_seq = 0
+        self._last_reply_at = 0.0
 
     async def start_heartbeat(self):
         if self.heartbeat_task is None or self.heartbeat_task.done():
             self.heartbeat_task = asyncio.create_task(self._heartbeat())
 
     async def _heartbeat(self):
-        while self.client.is_connected:
+        """Keep the link alive, skipping heartbeats while other requests are being acknowledged."""
+        # A requested disconnect ends the loop even if its cancel got lost
+        while self.is_connected and self.desired_connection_state == DesiredConnectionState.CONNECTED:
             try:
-                heartbeat = construct_heartbeat(1)
-                await self.send(heartbeat)
+                idle = time.perf_counter() - self._last_reply_at
+                if idle < self.heartbeat_freq:
+                    await asyncio.sleep(self.heartbeat_freq - idle)
+                    continue
+
+                self._heartbeat_seq = (self._heartbeat_seq + 1) % 0xFF
+                heartbeat = construct_heartbeat(self._heartbeat_seq)
+                sent_at = time.perf_counter()
+                echo = await self.request(
+                    heartbeat,
+                    timeout=self.link_quality.reply_timeout(self.heartbeat_freq),
+                    priority=SendPriority.HEARTBEAT,
+                )
+                if echo is None:
+                    self.link_quality.record_loss()
+                else:
+                    self.link_quality.record_rtt(time.perf_counter() - sent_at)
                 await asyncio.sleep(self.heartbeat_freq)
             except Exception as e:
                 logger.error(f"Heartbeat error for {self.name}: {e}")
@@ -163,18 +486,170 @@ class Glass(BleDevice):
         await self.start_heartbeat()
 
     async def disconnect(self):
+        self.desired_connection_state = DesiredConnectionState.DISCONNECTED
         if self.heartbeat_task and not self.heartbeat_task.done():
             self.heartbeat_task.cancel()
             try:
                 await self.heartbeat_task
             except asyncio.CancelledError:
                 pass
+        self._cancel_pending_replies()
+        await self.inbound.stop()
         await super().disconnect()
-    
+
+    async def request(
+        self,
+        data: bytes,
+        timeout: float = 1.0,
+        priority: Optional[SendPriority] = None,
+    ) -> Optional[bytes]:
+        """Send ``data`` and wait for the glasses' reply to it.
+
+        Replies are matched on the command byte and, for commands whose reply
+        echoes it, the sequence number. Returns None if the send failed or no
+        reply arrived within ``timeout`` seconds.
+        """
+        command = data[0]
+        waiter = asyncio.get_running_loop().create_future()
+        entry = (reply_sequence(data), waiter)
+        pending = self._pending_replies.setdefault(command, deque())
+        pending.append(entry)
+        try:
+            if not await self.send(data, priority=priority):
+                return None
+            sent_at = time.perf_counter()
+            # Unlike wait_for, wait never turns a cancel into the reply that raced it
+            await asyncio.wait((waiter,), timeout=timeout)
+            if not waiter.done():
+                logger.warning(f"No reply to 0x{command:02X} from {self.name} within {timeout}s")
+                return None
+            reply = waiter.result()
+            if reply is not None:
+                self.send_metrics.record(command, "ack_rtt", time.perf_counter() - sent_at)
+            return reply
+        finally:
+            if entry in pending:
+                pending.remove(entry)
+
+    async def request_many(
+        self,
+        packets: List[bytes],
+        timeout: float = 1.0,
+        bulk: bool = True,
+        priority: Optional[SendPriority] = None,
+    ) -> List[Optional[bytes]]:
+        """Send packets back to back with ``send_many`` and collect the reply to each.
+
+        Replies are matched to packets in send order. Returns one entry per
+        delivered packet, None where no reply arrived within ``timeout``
+        seconds of the last write; fewer entries than packets means the batch
+        failed midway.
+        """
+        loop = asyncio.get_running_loop()
+        entries = []
+        for packet in packets:
+            entry = (reply_sequence(packet), loop.create_future())
+            self._pending_replies.setdefault(packet[0], deque()).append(entry)
+            entries.append((packet[0], entry))
+        try:
+            sent = await self.send_many(packets, bulk=bulk, priority=priority)
+            waiters = [waiter for _, (_, waiter) in entries[:sent]]
+            if waiters:
+                sent_at = time.perf_counter()
+                _, missing = await asyncio.wait(waiters, timeout=timeout)
+                if missing:
+                    logger.warning(
+                        f"No reply to {len(missing)} of {len(waiters)} packets "
+                        f"from {self.name} within {timeout}s"
+                    )
+                else:
+                    self.send_metrics.record(
+                        packets[0][0], "ack_rtt", time.perf_counter() - sent_at
+                    )
+            return [waiter.result() if waiter.done() else None for waiter in waiters]
+        finally:
+            for command, entry in entries:
+                pending = self._pending_replies.get(command)
+                if pending and entry in pending:
+                    pending.remove(entry)
+
+    def _resolve_pending_reply(self, data: bytes):
+        pending = self._pending_replies.get(data[0])
+        if not pending:
+            return
+        sequence = reply_sequence(data)
+        for entry in pending:
+            expected, waiter = entry
+            if expected is None or sequence is None or expected == sequence:
+                pending.remove(entry)
+                self._last_reply_at = time.perf_counter()
+                if not waiter.done():
+                    waiter.set_result(bytes(data))
+                return
+
+    def _cancel_pending_replies(self):
+        for pending in self._pending_replies.values():
+            for _, waiter in pending:
+                if not waiter.done():
+                    waiter.set_result(None)
+            pending.clear()
+
+    def metrics_snapshot(self) -> Dict:
+        snapshot = super().metrics_snapshot()
+        snapshot["link_quality"] = self.link_quality.snapshot()
+        snapshot["inbound"] = self.inbound.snapshot()
+        return snapshot
+
     async def handle_notification(self, sender: int, data: bytes):
-        logger.info(f"Notification from {self.name}: {data.hex()}")
+        if packet_log.enabled:
+            packet_log.record(self.name, RX, data)
+        if data:
+            self._resolve_pending_reply(data)
+            if self.event_hub.by_command[data[0]]:
+                self.event_hub.publish(data)
         if self.notification_handler:
-            await self.notification_handler(self,sender, data)
+            await self.inbound.put(sender, data)
+
+    def events(
+        self,
+        filter: EventFilter = None,
+        maxsize: int = 256,
+        overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ) -> EventSubscription:
+        """Subscribe to packets from this arm, e.g. ``async for event in glass.events(Command.START_AI)``."""
+        subscription = EventSubscription(filter, maxsize, overflow)
+        self.event_hub.subscribe(subscription)
+        return subscription
+
+    async def _deliver_notification(self, sender: int, data: bytes):
+        if self.notification_handler:
+            await self.notification_handler(self, sender, data)
+
+
+# How each command is spread over the two arms. The protocol wants the left
+# arm to acknowledge before the right one is written unless the command only
+# changes a setting, which the arms apply independently.
+DISPATCH_POLICIES: Dict[int, DispatchPolicy] = {
+    Command.BRIGHTNESS: DispatchPolicy.PARALLEL,
+    Command.SILENT_MODE: DispatchPolicy.PARALLEL,
+    Command.HEADUP_ANGLE: DispatchPolicy.PARALLEL,
+    Command.DASHBOARD_POSITION: DispatchPolicy.PARALLEL,
+    Command.DASHBOARD_SHOW: DispatchPolicy.PARALLEL,
+    Command.GLASSES_WEAR: DispatchPolicy.PARALLEL,
+    Command.BMP_DATA: DispatchPolicy.PARALLEL,
+    Command.SEND_RESULT: DispatchPolicy.LEFT_THEN_RIGHT,
+    Command.NOTIFICATION: DispatchPolicy.LEFT_THEN_RIGHT,
+    Command.OPEN_MIC: DispatchPolicy.RIGHT_ONLY,
+}
+
+
+def glass_side(device_name: str) -> Optional[str]:
+    """Arm a G1 advertisement name belongs to, None for other devices."""
+    if "_L_" in device_name:
+        return "left"
+    if "_R_" in device_name:
+        return "right"
+    return None
 
 
 class GlassesManager:
@@ -186,55 +661,302 @@ class GlassesManager:
         right_address: str = None,
         left_name: str = "G1 Left Glass",
         right_name: str = "G1 Right Glass",
+        transport_factory: Optional[Callable[[str], Transport]] = None,
+        pipelined: bool = False,
+        registry: Optional[DeviceRegistry] = None,
     ):
+        # Builds the transport for a discovered address; BleakTransport when unset
+        self.transport_factory = transport_factory
+        self.pipelined = pipelined
+        self.last_dispatch: Optional[DispatchResult] = None
+        # Remembers connected pairs so the next start can skip discovery
+        self.registry = registry
+        # Open events() subscriptions, also attached to arms created later
+        self._subscriptions: List[EventSubscription] = []
         self.left_glass: Optional[Glass] = (
-            Glass(name=left_name, address=left_address, side="left")
+            self._create_glass(left_name, left_address, "left")
             if left_address
             else None
         )
         self.right_glass: Optional[Glass] = (
-            Glass(name=right_name, address=right_address, side="right")
+            self._create_glass(right_name, right_address, "right")
             if right_address
             else None
         )
 
-    async def scan_and_connect(self, timeout: int = 10) -> bool:
-        """Scan for glasses devices and connect to them."""
-        try:
-            logger.info("Scanning for glasses devices...")
-            devices = await BleakScanner.discover(timeout=timeout)
-            for device in devices:
-                device_name = device.name or "Unknown"
-                logger.info(f"Found device: {device_name}, Address: {device.address}")
-                if "_L_" in device_name and not self.left_glass:
-                    self.left_glass = Glass(name=device_name, address=device.address, side="left")
-                elif "_R_" in device_name and not self.right_glass:
-                    self.right_glass = Glass(name=device_name, address=device.address, side="right")
-
-            connect_tasks = []
+    def _create_glass(self, name: str, address: str, side: str) -> Glass:
+        transport = self.transport_factory(address) if self.transport_factory else None
+        glass = Glass(
+            name=name,
+            address=address,
+            side=side,
+            transport=transport,
+            pipelined=self.pipelined,
+        )
+        self._subscriptions = [s for s in self._subscriptions if not s.closed]
+        for subscription in self._subscriptions:
+            glass.event_hub.subscribe(subscription)
+        return glass
+
+    def events(
+        self,
+        filter: EventFilter = None,
+        maxsize: int = 256,
+        overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ) -> EventSubscription:
+        """Subscribe to packets from both arms, merged and tagged with ``event.side``.
+
+        ``filter`` takes a command byte or several; every subscription has a
+        buffer of its own, so consumers such as a UI, a logger and an AI
+        pipeline do not wait on each other. Packets too short for their
+        command are not published, so ``event.packet`` always has its fields::
+
+            async with manager.events(filter=Command.START_AI) as events:
+                async for event in events:
+                    print(event.side, event.packet.sub_command)
+        """
+        subscription = EventSubscription(filter, maxsize, overflow)
+        for glass in (self.left_glass, self.right_glass):
+            if glass:
+                glass.event_hub.subscribe(subscription)
+        self._subscriptions.append(subscription)
+        return subscription
+
+    def packet_budget(self, header: int, maximum: int) -> int:
+        """Payload bytes per packet fitting the MTU of every arm."""
+        return min(
+            (
+                glass.packet_budget(header, maximum)
+                for glass in (self.left_glass, self.right_glass)
+                if glass
+            ),
+            default=maximum,
+        )
+
+    @staticmethod
+    def policy_for(command: int) -> DispatchPolicy:
+        return DISPATCH_POLICIES.get(command, DispatchPolicy.LEFT_THEN_RIGHT)
+
+    async def run_with_policy(
+        self,
+        policy: DispatchPolicy,
+        operation: Callable[[Glass], Awaitable[Optional[bool]]],
+    ) -> DispatchResult:
+        """Run ``operation`` on the arms selected by ``policy`` and time each arm.
+
+        ``operation`` returns True on success, False on failure and None when
+        the outcome is unknown (no acknowledgment); with LEFT_THEN_RIGHT only
+        an explicit failure on the left arm keeps the right one from running.
+        """
+        result = DispatchResult(policy=policy)
+        start = time.perf_counter()
+
+        async def run(glass: Glass, side: str):
+            ok = await operation(glass)
+            setattr(result, f"{side}_ok", ok)
+            setattr(result, f"{side}_latency", time.perf_counter() - start)
+
+        if policy == DispatchPolicy.PARALLEL:
+            arms = [
+                run(glass, glass.side)
+                for glass in (self.left_glass, self.right_glass)
+                if glass
+            ]
+            await asyncio.gather(*arms)
+        elif policy == DispatchPolicy.LEFT_THEN_RIGHT:
+            if self.left_glass:
+                await run(self.left_glass, "left")
+            if self.right_glass and result.left_ok is not False:
+                await run(self.right_glass, "right")
+        elif policy == DispatchPolicy.LEFT_ONLY:
             if self.left_glass:
-                connect_tasks.append(asyncio.create_task(self.left_glass.connect()))
+                await run(self.left_glass, "left")
+        elif policy == DispatchPolicy.RIGHT_ONLY:
             if self.right_glass:
-                connect_tasks.append(asyncio.create_task(self.right_glass.connect()))
+                await run(self.right_glass, "right")
 
-            if connect_tasks:
-                self.desired_connection_state = DesiredConnectionState.CONNECTED
-                await asyncio.gather(*connect_tasks)
-                logger.info("All glasses connected successfully.")
-                return True
+        self.last_dispatch = result
+        if result.skew is not None:
+            logger.debug(f"{policy.name} dispatch skew between arms: {result.skew * 1000:.1f} ms")
+        return result
+
+    async def dispatch(
+        self,
+        command: bytes,
+        policy: Optional[DispatchPolicy] = None,
+        ack_timeout: float = 0.1,
+    ) -> DispatchResult:
+        """Send a command to the arms its dispatch policy selects and await acknowledgments."""
+        if policy is None:
+            policy = self.policy_for(command[0])
+
+        async def send(glass: Glass) -> Optional[bool]:
+            reply = await glass.request(command, timeout=ack_timeout)
+            if reply is None:
+                return None
+            return not is_failure_reply(reply)
+
+        return await self.run_with_policy(policy, send)
+
+    def _glass_for_side(self, side: str) -> Optional[Glass]:
+        return self.left_glass if side == "left" else self.right_glass
+
+    def _load_cached_pair(self):
+        record = self.registry.latest()
+        if record:
+            logger.info(f"Trying cached pair {record.left_name} / {record.right_name}")
+            self.left_glass = self._create_glass(record.left_name, record.left_address, "left")
+            self.right_glass = self._create_glass(record.right_name, record.right_address, "right")
+
+    async def scan_and_connect(
+        self, timeout: int = 10, filter_uart_service: bool = False
+    ) -> ScanResult:
+        """Scan for glasses devices and connect to each arm as soon as it is seen.
+
+        Arms with a known address, given to the constructor or cached in the
+        registry, are connected directly while the scan runs; an arm found by
+        the scan is only connected from its advertisement if the direct
+        attempt failed. Scanning stops once both arms are connected or found,
+        or after ``timeout`` seconds. With ``filter_uart_service`` only devices
+        advertising the UART service are reported. The result is truthy when
+        every arm found was connected.
+        """
+        result = ScanResult()
+        started_at = time.perf_counter()
+        attempts: Dict[str, asyncio.Task] = {}
+        discovered: Dict[str, Tuple[str, str]] = {}
+        # Sides whose current attempt uses the address the scan found
+        from_scan: Set[str] = set()
+        settled = asyncio.Event()
+
+        if self.registry and not self.left_glass and not self.right_glass:
+            self._load_cached_pair()
+
+        def failed(side: str) -> bool:
+            task = attempts[side]
+            return task.done() and (task.cancelled() or task.exception() is not None)
+
+        def connected(side: str) -> bool:
+            return side in attempts and attempts[side].done() and not failed(side)
+
+        def check_settled():
+            if all(side in discovered or connected(side) for side in ("left", "right")):
+                settled.set()
+
+        async def connect(glass: Glass):
+            await glass.connect()
+            if result.time_to_first_connect is None:
+                result.time_to_first_connect = time.perf_counter() - started_at
+
+        def on_attempt_done(side: str):
+            if failed(side) and side in discovered and side not in from_scan:
+                # The cached address did not answer; use what the scan found
+                start_connecting(side, *discovered[side])
+            check_settled()
+
+        def start_connecting(side: str, device_name: Optional[str] = None, address: Optional[str] = None):
+            glass = self._glass_for_side(side)
+            if address and (glass is None or glass.address != address):
+                glass = self._create_glass(device_name, address, side)
+                setattr(self, f"{side}_glass", glass)
+            if address:
+                from_scan.add(side)
+            task = asyncio.create_task(connect(glass))
+            task.add_done_callback(lambda _: on_attempt_done(side))
+            attempts[side] = task
+
+        def on_detection(device, advertisement_data):
+            device_name = device.name or advertisement_data.local_name or "Unknown"
+            side = glass_side(device_name)
+            if side is None or side in discovered:
+                return
+            logger.info(f"Found device: {device_name}, Address: {device.address}")
+            discovered[side] = (device_name, device.address)
+            if side not in attempts or failed(side):
+                start_connecting(side, device_name, device.address)
+            check_settled()
+
+        try:
+            for glass in (self.left_glass, self.right_glass):
+                if glass:
+                    start_connecting(glass.side)
+
+            logger.info("Scanning for glasses devices...")
+            scanner = BleakScanner(
+                detection_callback=on_detection,
+                service_uuids=[UART_SERVICE_UUID] if filter_uart_service else None,
+            )
+            try:
+                await scanner.start()
+            except Exception as e:
+                if not attempts:
+                    raise
+                # Known addresses can still be connected directly
+                logger.warning(f"Scanning unavailable, connecting to known addresses: {e}")
             else:
+                try:
+                    await asyncio.wait_for(settled.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+                finally:
+                    await scanner.stop()
+
+            if not attempts:
                 logger.error("No glasses devices found during scan.")
-                return False
+                return result
+
+            # Failed attempts may be retried from the scan, so wait for the last ones
+            while not all(task.done() for task in attempts.values()):
+                await asyncio.wait(list(attempts.values()))
+
+            self.desired_connection_state = DesiredConnectionState.CONNECTED
+            for side in attempts:
+                if failed(side):
+                    logger.error(f"Could not connect to the {side} glass.")
+            if all(not failed(side) for side in attempts):
+                logger.info("All glasses connected successfully.")
+                result.connected = True
+                if self.registry and self.left_glass and self.right_glass:
+                    self.registry.record(
+                        self.left_glass.address,
+                        self.left_glass.name,
+                        self.right_glass.address,
+                        self.right_glass.name,
+                    )
         except Exception as e:
             logger.error(f"Error during scan and connect: {e}")
-            return False
+            for task in attempts.values():
+                task.cancel()
+        finally:
+            result.left_address = self.left_glass.address if self.left_glass else None
+            result.right_address = self.right_glass.address if self.right_glass else None
+            result.elapsed = time.perf_counter() - started_at
+        return result
+
+    def metrics_snapshot(self) -> Dict[str, Dict]:
+        """Per-arm ``metrics_snapshot`` keyed by side."""
+        return {
+            glass.side: glass.metrics_snapshot()
+            for glass in (self.left_glass, self.right_glass)
+            if glass
+        }
+
+    async def reconnect_all(self) -> bool:
+        """Reconnect both arms concurrently, joining reconnects already in progress."""
+        tasks = [
+            glass.start_reconnect()
+            for glass in (self.left_glass, self.right_glass)
+            if glass and not glass.is_connected
+        ]
+        results = await asyncio.gather(*tasks)
+        return all(results)
 
     async def disconnect_all(self):
-        """Disconnect from all connected glasses."""
+        """Disconnect from all glasses, stopping any reconnect in progress."""
         disconnect_tasks = []
-        if self.left_glass and self.left_glass.client.is_connected:
+        if self.left_glass:
             disconnect_tasks.append(asyncio.create_task(self.left_glass.disconnect()))
-        if self.right_glass and self.right_glass.client.is_connected:
+        if self.right_glass:
             disconnect_tasks.append(asyncio.create_task(self.right_glass.disconnect()))
         if disconnect_tasks:
             try:
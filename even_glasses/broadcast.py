@@ -0,0 +1,127 @@
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Dict, List, Mapping, Optional, Sequence, Union
+
+from even_glasses.bluetooth_manager import GlassesManager
+from even_glasses.commands import build_text_packets, send_text_packets, send_notification_chunks
+from even_glasses.models import BroadcastResult, BroadcastTargetResult, NCSNotification
+from even_glasses.utils import (
+    construct_notification,
+    NOTIFICATION_CHUNK_SIZE,
+    NOTIFICATION_CHUNK_HEADER,
+)
+
+logger = logging.getLogger(__name__)
+
+Targets = Union[Mapping[str, GlassesManager], Sequence[GlassesManager]]
+
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_DEADLINE = 10.0
+
+
+def _keyed(targets: Targets) -> Dict[str, GlassesManager]:
+    if isinstance(targets, Mapping):
+        return dict(targets)
+    return {str(index): manager for index, manager in enumerate(targets)}
+
+
+async def broadcast(
+    targets: Targets,
+    send: Callable[[GlassesManager], Awaitable[bool]],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    deadline: Optional[float] = DEFAULT_DEADLINE,
+) -> BroadcastResult:
+    """Run ``send`` against every manager, at most ``max_concurrency`` at a time.
+
+    ``targets`` is a list of managers or a mapping such as ``FleetManager.managers``.
+    Each target gets ``deadline`` seconds from the moment it starts, so a stalled
+    pair is reported as failed instead of delaying the others.
+    """
+    slots = asyncio.Semaphore(max_concurrency)
+    started_at = time.perf_counter()
+
+    async def run(target: str, manager: GlassesManager) -> BroadcastTargetResult:
+        async with slots:
+            target_started_at = time.perf_counter()
+            error = None
+            try:
+                ok = bool(await asyncio.wait_for(send(manager), deadline))
+                if not ok:
+                    error = "rejected"
+            except asyncio.TimeoutError:
+                ok, error = False, f"deadline of {deadline}s exceeded"
+            except Exception as e:
+                ok, error = False, str(e) or type(e).__name__
+            if error:
+                logger.warning(f"Broadcast to {target} failed: {error}")
+            return BroadcastTargetResult(
+                target=target,
+                ok=ok,
+                latency=time.perf_counter() - target_started_at,
+                error=error,
+            )
+
+    results: List[BroadcastTargetResult] = await asyncio.gather(
+        *(run(target, manager) for target, manager in _keyed(targets).items())
+    )
+    return BroadcastResult(results=results, elapsed=time.perf_counter() - started_at)
+
+
+async def broadcast_text(
+    targets: Targets,
+    text_message: str,
+    duration: float = 5,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    deadline: Optional[float] = None,
+) -> BroadcastResult:
+    """Show the same text on every pair, encoding its pages once.
+
+    Without a ``deadline`` each target gets the default plus the time its pages
+    are displayed.
+    """
+    groups = build_text_packets(text_message)
+    if deadline is None:
+        deadline = DEFAULT_DEADLINE + duration * max(len(groups) - 1, 0)
+    return await broadcast(
+        targets,
+        lambda manager: send_text_packets(manager, groups, duration),
+        max_concurrency=max_concurrency,
+        deadline=deadline,
+    )
+
+
+async def broadcast_notification(
+    targets: Targets,
+    notification: NCSNotification,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    deadline: Optional[float] = DEFAULT_DEADLINE,
+) -> BroadcastResult:
+    """Send the same notification to every pair, chunking it once per packet size."""
+    chunks_by_size: Dict[int, List[bytes]] = {}
+
+    async def send(manager: GlassesManager) -> bool:
+        max_chunk_size = manager.packet_budget(NOTIFICATION_CHUNK_HEADER, NOTIFICATION_CHUNK_SIZE)
+        if max_chunk_size not in chunks_by_size:
+            chunks_by_size[max_chunk_size] = await construct_notification(
+                notification, max_chunk_size
+            )
+        return await send_notification_chunks(manager, chunks_by_size[max_chunk_size])
+
+    return await broadcast(targets, send, max_concurrency=max_concurrency, deadline=deadline)
+
+
+async def broadcast_command(
+    targets: Targets,
+    command: bytes,
+    ack_timeout: float = 0.1,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    deadline: Optional[float] = DEFAULT_DEADLINE,
+) -> BroadcastResult:
+    """Send an encoded command to every pair following its dispatch policy."""
+
+    async def send(manager: GlassesManager) -> bool:
+        result = await manager.dispatch(command, ack_timeout=ack_timeout)
+        return result.succeeded
+
+    return await broadcast(targets, send, max_concurrency=max_concurrency, deadline=deadline)
@@ -0,0 +1,265 @@
+import json
+import struct
+import zlib
+from typing import List
+
+from even_glasses.models import Command, NoteConstants, SubCommand
+
+# Wire encoders of every outbound command, for the send paths. They take
+# plain ints and bytes-like payloads, build no models and write each packet
+# once: ``pack_*_into`` into a caller's buffer, ``encode_*`` into a new bytes.
+# The pydantic models in ``models`` stay the validating front end.
+
+_SEND_RESULT = int(Command.SEND_RESULT)
+_NOTIFICATION = int(Command.NOTIFICATION)
+_HEARTBEAT = int(Command.HEARTBEAT)
+_BMP_DATA = int(Command.BMP_DATA)
+_CRC_CHECK = int(Command.CRC_CHECK)
+_NOTE = int(NoteConstants.COMMAND)
+
+HEARTBEAT = struct.Struct("<6B")
+# Command, seq, total and current package, screen status, new character
+# position (high byte first), page number and page count
+SEND_RESULT_HEADER = struct.Struct("<9B")
+# Command, notification id, chunk count and chunk index
+NOTIFICATION_CHUNK_HEADER = struct.Struct("<4B")
+# Command and seq, plus the storage address on the first packet
+BMP_HEADER = struct.Struct("<2B")
+BMP_FIRST_HEADER = struct.Struct("<2B4s")
+BMP_ADDRESS = b"\x00\x1c\x00\x00"
+CRC_CHECK = struct.Struct(">BI")
+# Command, length, fixed byte, version, fixed bytes, note number, fixed
+# byte and title length
+NOTE_HEADER = struct.Struct("<4B5s3B")
+NOTE_FIXED_BYTES = b"\x03\x01\x00\x01\x00"
+_NOTE_OVERHEAD = 14
+
+
+def pack_heartbeat_into(buffer, offset: int, seq: int) -> int:
+    HEARTBEAT.pack_into(buffer, offset, _HEARTBEAT, 6, 0, seq % 0xFF, 0x04, seq % 0xFF)
+    return HEARTBEAT.size
+
+
+def encode_heartbeat(seq: int) -> bytes:
+    return HEARTBEAT.pack(_HEARTBEAT, 6, 0, seq % 0xFF, 0x04, seq % 0xFF)
+
+
+def pack_send_result_into(
+    buffer,
+    offset: int,
+    data,
+    seq: int = 0,
+    total_packages: int = 1,
+    current_package: int = 0,
+    screen_status: int = 0x31,
+    char_position: int = 0,
+    page_number: int = 1,
+    max_pages: int = 1,
+) -> int:
+    """Write a SendResult packet carrying ``data`` at ``offset``; returns its length."""
+    SEND_RESULT_HEADER.pack_into(
+        buffer,
+        offset,
+        _SEND_RESULT,
+        seq,
+        total_packages,
+        current_package,
+        screen_status,
+        (char_position >> 8) & 0xFF,
+        char_position & 0xFF,
+        page_number,
+        max_pages,
+    )
+    start = offset + SEND_RESULT_HEADER.size
+    buffer[start : start + len(data)] = data
+    return SEND_RESULT_HEADER.size + len(data)
+
+
+def encode_send_result(
+    data,
+    seq: int = 0,
+    total_packages: int = 1,
+    current_package: int = 0,
+    screen_status: int = 0x31,
+    char_position: int = 0,
+    page_number: int = 1,
+    max_pages: int = 1,
+) -> bytes:
+    return (
+        SEND_RESULT_HEADER.pack(
+            _SEND_RESULT,
+            seq,
+            total_packages,
+            current_package,
+            screen_status,
+            (char_position >> 8) & 0xFF,
+            char_position & 0xFF,
+            page_number,
+            max_pages,
+        )
+        + data
+    )
+
+
+def encode_send_result_packages(header: bytes, chunks: List) -> List[bytes]:
+    """SendResult packages of ``chunks`` under the header of an encoded page.
+
+    Every package gets the page header with its own ``total_packages`` and
+    ``current_package``. The packages are written into one buffer and then
+    cut out of it, without intermediate copies.
+    """
+    total = len(chunks)
+    size = SEND_RESULT_HEADER.size
+    buffer = bytearray(size * total + sum(map(len, chunks)))
+    offsets = []
+    offset = 0
+    for index, chunk in enumerate(chunks):
+        buffer[offset : offset + size] = header
+        buffer[offset + 2] = total
+        buffer[offset + 3] = index
+        buffer[offset + size : offset + size + len(chunk)] = chunk
+        offsets.append(offset)
+        offset += size + len(chunk)
+    offsets.append(offset)
+    view = memoryview(buffer)
+    return [bytes(view[start:end]) for start, end in zip(offsets, offsets[1:])]
+
+
+# Keys of an NCS notification in the order the firmware receives them
+NCS_NOTIFICATION_FIELDS = (
+    "msg_id", "type", "app_identifier", "title", "subtitle", "message", "time_s", "date", "display_name",
+)
+
+
+def encode_notification_json(ncs_notification) -> bytes:
+    """JSON of an "Add" notification as ``Notification.to_bytes`` writes it, without a model dump."""
+    fields = {name: getattr(ncs_notification, name) for name in NCS_NOTIFICATION_FIELDS}
+    return json.dumps({"ncs_notification": fields, "type": "Add"}).encode("utf-8")
+
+
+def encode_notification_chunks(payload: bytes, max_chunk_size: int, notify_id: int = 0) -> List[bytes]:
+    """Notification chunks of a JSON ``payload``, each behind its 4-byte header."""
+    starts = range(0, len(payload), max_chunk_size)
+    total = len(starts)
+    if total > 0xFF:
+        raise ValueError(
+            f"Notification of {len(payload)} bytes needs {total} chunks of {max_chunk_size} bytes, "
+            "more than the 255 its header can count"
+        )
+    pack = NOTIFICATION_CHUNK_HEADER.pack
+    return [
+        pack(_NOTIFICATION, notify_id, total, index) + payload[start : start + max_chunk_size]
+        for index, start in enumerate(starts)
+    ]
+
+
+def pack_bmp_packet_into(buffer, offset: int, seq: int, data, first: bool) -> int:
+    if first:
+        BMP_FIRST_HEADER.pack_into(buffer, offset, _BMP_DATA, seq & 0xFF, BMP_ADDRESS)
+        header = BMP_FIRST_HEADER.size
+    else:
+        BMP_HEADER.pack_into(buffer, offset, _BMP_DATA, seq & 0xFF)
+        header = BMP_HEADER.size
+    start = offset + header
+    buffer[start : start + len(data)] = data
+    return header + len(data)
+
+
+def encode_bmp_packet(seq: int, data, first: bool) -> bytes:
+    if first:
+        return BMP_FIRST_HEADER.pack(_BMP_DATA, seq & 0xFF, BMP_ADDRESS) + data
+    return BMP_HEADER.pack(_BMP_DATA, seq & 0xFF) + data
+
+
+def encode_bmp_packets(image_data, packet_size: int) -> List[bytes]:
+    """BMP data packets of an image, ``packet_size`` image bytes each."""
+    view = memoryview(image_data).cast("B")
+    if not len(view):
+        return []
+    total = -(-len(view) // packet_size)
+    if total > 0x100:
+        raise ValueError(
+            f"Image of {len(view)} bytes needs {total} packets of {packet_size} bytes, "
+            "more than the 256 its one-byte sequence number can tell apart"
+        )
+    packets = [BMP_FIRST_HEADER.pack(_BMP_DATA, 0, BMP_ADDRESS) + view[:packet_size]]
+    pack = BMP_HEADER.pack
+    for seq, start in enumerate(range(packet_size, len(view), packet_size), 1):
+        packets.append(pack(_BMP_DATA, seq & 0xFF) + view[start : start + packet_size])
+    return packets
+
+
+def encode_crc_check(image_data) -> bytes:
+    """CRC check command: CRC-32 of the storage address followed by the image."""
+    crc = zlib.crc32(image_data, zlib.crc32(BMP_ADDRESS))
+    return CRC_CHECK.pack(_CRC_CHECK, crc)
+
+
+def encode_note_add(note_number: int, name: str, text: str, version: int) -> bytes:
+    name_bytes = name.encode("utf-8")
+    text_bytes = text.encode("utf-8")
+    length = _NOTE_OVERHEAD + len(name_bytes) + len(text_bytes)
+    packet = bytearray(NOTE_HEADER.size + len(name_bytes) + 2 + len(text_bytes))
+    NOTE_HEADER.pack_into(
+        packet,
+        0,
+        _NOTE,
+        length & 0xFF,
+        NoteConstants.FIXED_BYTE,
+        version & 0xFF,
+        NOTE_FIXED_BYTES,
+        note_number,
+        NoteConstants.FIXED_BYTE_2,
+        len(name_bytes) & 0xFF,
+    )
+    offset = NOTE_HEADER.size
+    packet[offset : offset + len(name_bytes)] = name_bytes
+    offset += len(name_bytes)
+    packet[offset] = len(text_bytes) & 0xFF
+    packet[offset + 1] = NoteConstants.FIXED_BYTE
+    packet[offset + 2 :] = text_bytes
+    return bytes(packet)
+
+
+def encode_note_delete(note_number: int) -> bytes:
+    return bytes(
+        (_NOTE, 0x10, 0x00, 0xE0, 0x03, 0x01, 0x00, 0x01, 0x00, note_number, 0x00, 0x01, 0x00, 0x01, 0x00, 0x00)
+    )
+
+
+def encode_headup_angle(angle: int) -> bytes:
+    return bytes((Command.HEADUP_ANGLE, angle & 0xFF, 0x01))
+
+
+def encode_brightness(level: int, auto: int) -> bytes:
+    return bytes((Command.BRIGHTNESS, level, auto))
+
+
+def encode_silent_mode(status: int) -> bytes:
+    return bytes((Command.SILENT_MODE, status, 0x00))
+
+
+def encode_glasses_wear(status: int) -> bytes:
+    return bytes((Command.GLASSES_WEAR, status))
+
+
+def encode_dashboard_show_state(shown: bool, position: int) -> bytes:
+    return bytes(
+        (Command.DASHBOARD_POSITION, 0x07, 0x00, 0x01, 0x02, 0x01 if shown else 0x00, position)
+    )
+
+
+def encode_start_ai(subcmd: int, param: bytes = b"") -> bytes:
+    return bytes((Command.START_AI, subcmd)) + param
+
+
+def encode_clear_screen() -> bytes:
+    return bytes((Command.START_AI, SubCommand.STOP, 0x00, 0x00, 0x00))
+
+
+def encode_mic_command(enable: int) -> bytes:
+    return bytes((Command.OPEN_MIC, enable))
+
+
+def encode_packet_end() -> bytes:
+    return bytes((Command.PACKET_END, 0x0D, 0x0E))
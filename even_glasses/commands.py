@@ -1,5 +1,4 @@
 from even_glasses.models import (
-    SendResult,
     ScreenAction,
     AIStatus,
     RSVPConfig,
@@ -8,10 +7,18 @@ from even_glasses.models import (
     BrightnessAuto,
     DashboardState,
     GlassesWearStatus,
+    Command,
+    DispatchPolicy,
+    DispatchResult,
+    SendPriority,
+    StreamReport,
 )
 import asyncio
 import logging
-from typing import List
+import time
+from collections import deque
+from pathlib import Path
+from typing import AsyncIterable, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
 from even_glasses.utils import (
     construct_note_add,
     construct_silent_mode,
@@ -21,29 +28,157 @@ from even_glasses.utils import (
     construct_note_delete,
     construct_notification,
     construct_glasses_wear_command,
-    divide_image_data,
-    construct_bmp_data_packet,
     send_data_to_glass,
+    is_failure_reply,
+    IMAGE_PACKET_SIZE,
+    IMAGE_PACKET_HEADER,
+    NOTIFICATION_CHUNK_SIZE,
+    NOTIFICATION_CHUNK_HEADER,
+    SEND_RESULT_PAYLOAD_SIZE,
+    SEND_RESULT_HEADER,
 )
-import numpy as np
+from even_glasses.layout import (
+    layout_lines,
+    layout_pages,
+    iter_pages,
+    iter_located_pages,
+    count_pages,
+    read_chunks,
+    LINES_PER_PAGE,
+)
+from even_glasses.page_index import PageIndex
+from even_glasses.packet_cache import text_packet_cache
+from even_glasses.codec import encode_bmp_packets, encode_send_result, encode_send_result_packages
+
+logger = logging.getLogger(__name__)
+
+# Resends of a text package the glasses failed to take before the page is given up
+TEXT_PACKAGE_RETRIES = 2
 
 
 def format_text_lines(text: str) -> list:
     """Format text into lines that fit the display."""
-    paragraphs = [p.strip() for p in text.split("\n") if p.strip()]
-    lines = []
+    return list(layout_lines(text))
 
-    for paragraph in paragraphs:
-        while len(paragraph) > 40:
-            space_idx = paragraph.rfind(" ", 0, 40)
-            if space_idx == -1:
-                space_idx = 40
-            lines.append(paragraph[:space_idx])
-            paragraph = paragraph[space_idx:].strip()
-        if paragraph:
-            lines.append(paragraph)
 
-    return lines
+def build_text_packet(
+    text_message: str,
+    page_number: int = 1,
+    max_pages: int = 1,
+    screen_status: int = ScreenAction.NEW_CONTENT | AIStatus.DISPLAYING,
+    seq: int = 0,
+) -> bytes:
+    """Encode one page of text as a SendResult packet.
+
+    Packets are kept in ``text_packet_cache``, so showing a page again costs
+    no encoding.
+    """
+    key = (text_message, page_number, max_pages, screen_status, seq)
+    packet = text_packet_cache.get(key)
+    if packet is None:
+        packet = encode_send_result(
+            text_message.encode("utf-8"),
+            seq=seq,
+            screen_status=screen_status,
+            page_number=page_number,
+            max_pages=max_pages,
+        )
+        text_packet_cache.put(key, packet)
+    return packet
+
+
+def split_text_packet(packet: bytes, package_size: int) -> List[bytes]:
+    """Split an encoded page into packages of at most ``package_size`` payload bytes.
+
+    Packages end on UTF-8 character boundaries and carry their index in
+    ``current_package`` and their count in ``total_packages``.
+    """
+    payload = memoryview(packet)[SEND_RESULT_HEADER:]
+    if len(payload) <= package_size:
+        return [packet]
+    chunks = []
+    start = 0
+    while start < len(payload):
+        end = min(start + package_size, len(payload))
+        if end < len(payload):
+            # Back off to the first byte of a character cut by the limit
+            boundary = end
+            while boundary > start and payload[boundary] & 0xC0 == 0x80:
+                boundary -= 1
+            if boundary > start:
+                end = boundary
+        chunks.append(payload[start:end])
+        start = end
+    if len(chunks) > 0xFF:
+        raise ValueError(f"Page of {len(payload)} bytes needs more than 255 packages")
+    return encode_send_result_packages(packet[:SEND_RESULT_HEADER], chunks)
+
+
+async def send_text_packages(
+    glass, packages: List[bytes], timeout: float = 0.4, retries: int = TEXT_PACKAGE_RETRIES
+) -> Optional[bool]:
+    """Send the packages of one page to a glass back to back, resending only those that failed.
+
+    A package the glasses rejected or that was not written is sent again,
+    with the ones after it, up to ``retries`` times. Returns None when every
+    package was taken but some were not acknowledged.
+    """
+    start = 0
+    attempts = 0
+    acknowledged = True
+    while True:
+        remaining = packages[start:]
+        replies = await glass.request_many(
+            remaining, timeout=timeout, priority=SendPriority.INTERACTIVE
+        )
+        taken = next(
+            (index for index, reply in enumerate(replies) if is_failure_reply(reply)),
+            len(replies),
+        )
+        acknowledged = acknowledged and None not in replies[:taken]
+        if taken == len(remaining):
+            return True if acknowledged else None
+        start += taken
+        attempts += 1
+        if attempts > retries:
+            logger.error(
+                f"{glass.side.capitalize()} glass did not take text package "
+                f"{start + 1}/{len(packages)} after {retries} retries"
+            )
+            return False
+        logger.warning(
+            f"Resending text package {start + 1}/{len(packages)} to the {glass.side} glass"
+        )
+
+
+async def dispatch_text_packet(
+    manager, packet: bytes, delay: float = 0.4, retries: int = TEXT_PACKAGE_RETRIES
+) -> bool:
+    """Send an encoded page to the left then the right glass.
+
+    Each arm gets the page split into packages that fit its MTU, see
+    ``split_text_packet``; ``delay`` bounds the wait for their acknowledgments.
+    """
+    if manager.left_glass and manager.right_glass:
+        packages_by_size = {}
+
+        async def send_to_glass(glass) -> Optional[bool]:
+            package_size = glass.packet_budget(SEND_RESULT_HEADER, SEND_RESULT_PAYLOAD_SIZE)
+            if package_size not in packages_by_size:
+                packages_by_size[package_size] = split_text_packet(packet, package_size)
+            return await send_text_packages(
+                glass, packages_by_size[package_size], delay, retries
+            )
+
+        # Left glass first, right glass once the left one acknowledged
+        result = await manager.run_with_policy(DispatchPolicy.LEFT_THEN_RIGHT, send_to_glass)
+        if not result.succeeded:
+            logger.error("Glasses rejected the text packet.")
+            return False
+        return True
+    else:
+        logger.error("Could not connect to glasses devices.")
+        return False
 
 
 async def send_text_packet(
@@ -55,91 +190,276 @@ async def send_text_packet(
     wait: float = 2,
     delay: float = 0.4,
     seq: int = 0,
-) -> str:
-    text_bytes = text_message.encode("utf-8")
-
-    result = SendResult(
-        seq=seq,
-        total_packages=1,
-        current_package=0,
-        screen_status=screen_status,
-        new_char_pos0=0,
-        new_char_pos1=0,
-        page_number=page_number,
-        max_pages=max_pages,
-        data=text_bytes,
-    )
-    ai_result_command = result.build()
+) -> bool:
+    """Send one page to the left then the right glass.
+
+    Each arm's acknowledgment is awaited for at most ``delay`` seconds.
+    """
+    packet = build_text_packet(text_message, page_number, max_pages, screen_status, seq)
+    return await dispatch_text_packet(manager, packet, delay)
+
+
+def page_text(page_lines: Tuple[str, ...]) -> str:
+    """Text of a page as displayed, vertically centered."""
+    # Add vertical centering for pages with fewer than 5 lines
+    if len(page_lines) < LINES_PER_PAGE:
+        padding = (LINES_PER_PAGE - len(page_lines)) // 2
+        page_lines = (
+            ("",) * padding
+            + page_lines
+            + ("",) * (LINES_PER_PAGE - len(page_lines) - padding)
+        )
+    return "\n".join(page_lines)
+
+
+def iter_text_packets(pages: Iterable[Tuple[str, ...]], total_pages: int) -> Iterator[List[bytes]]:
+    """Encode pages lazily into groups of packets to be shown one after another."""
+    pages = iter(pages)
+    page_lines = next(pages, None)
+    pn = 1
+    while page_lines is not None:
+        first_line = page_lines[0]
+        text = page_text(page_lines)
+        group = [build_text_packet(text, pn, total_pages, AIStatus.DISPLAYING)]
+        if pn == 1 and total_pages > 1:
+            # Announce the new content with its first line
+            group.insert(
+                0,
+                build_text_packet(
+                    first_line, 1, total_pages, AIStatus.DISPLAYING | ScreenAction.NEW_CONTENT
+                ),
+            )
 
-    if manager.left_glass and manager.right_glass:
-        # Send to the left glass and wait for acknowledgment
-        await manager.left_glass.send(ai_result_command)
-        await asyncio.sleep(delay)
-        # Send to the right glass and wait for acknowledgment
-        await manager.right_glass.send(ai_result_command)
-        await asyncio.sleep(delay)
-
-        return text_message
-    else:
-        logging.error("Could not connect to glasses devices.")
-        return False
+        page_lines = next(pages, None)
+        if page_lines is None:
+            # After all pages, send the last page again with DISPLAY_COMPLETE status
+            group.append(
+                build_text_packet(text, total_pages, total_pages, AIStatus.DISPLAY_COMPLETE)
+            )
+        yield group
+        pn += 1
 
 
-async def send_text(manager, text_message: str, duration: float = 5) -> str:
-    """Send text message to the glasses display."""
-    lines = format_text_lines(text_message)
-    total_pages = (len(lines) + 4) // 5  # 5 lines per page
-
-    if total_pages > 1:
-        logging.info(f"Sending {total_pages} pages with {duration} seconds delay")
-        screen_status = AIStatus.DISPLAYING | ScreenAction.NEW_CONTENT
-        await send_text_packet(
-            manager=manager,
-            text_message=lines[0],
-            page_number=1,
-            max_pages=total_pages,
-            screen_status=screen_status,
-        )
-        await asyncio.sleep(0.1)
+def build_text_packets(text_message: str) -> List[List[bytes]]:
+    """Encode text into groups of page packets to be shown one after another."""
+    pages = layout_pages(text_message)
+    return list(iter_text_packets(pages, len(pages)))
 
-    for pn, page in enumerate(range(0, len(lines), 5), start=1):
-        page_lines = lines[page : page + 5]
 
-        # Add vertical centering for pages with fewer than 5 lines
-        if len(page_lines) < 5:
-            padding = (5 - len(page_lines)) // 2
-            page_lines = (
-                [""] * padding + page_lines + [""] * (5 - len(page_lines) - padding)
-            )
+async def _iterate(items: Iterable):
+    for item in items:
+        yield item
 
-        text = "\n".join(page_lines)
-        screen_status = AIStatus.DISPLAYING
 
-        await send_text_packet(
-            manager=manager,
-            text_message=text,
-            page_number=pn,
-            max_pages=total_pages,
-            screen_status=screen_status,
-        )
+async def _iter_text_packets_in_thread(pages: Iterator[Tuple[str, ...]], total_pages: int):
+    """``iter_text_packets`` over pages read and laid out in a worker thread.
+
+    Packets are still encoded on the event loop, which owns ``text_packet_cache``;
+    the pages each group needs, itself and the next one, are fetched first.
+    """
+    buffered = deque()
 
+    def take():
+        while buffered:
+            yield buffered.popleft()
+
+    groups = iter_text_packets(take(), total_pages)
+    exhausted = False
+    while True:
+        while not exhausted and len(buffered) < 2:
+            page_lines = await asyncio.to_thread(next, pages, None)
+            if page_lines is None:
+                exhausted = True
+            else:
+                buffered.append(page_lines)
+        group = next(groups, None)
+        if group is None:
+            return
+        yield group
+
+
+async def send_text_packets(
+    manager,
+    groups: Union[Iterable[List[bytes]], AsyncIterable[List[bytes]]],
+    duration: float = 5,
+    delay: float = 0.4,
+) -> bool:
+    """Send page groups from ``build_text_packets``, ``duration`` seconds apart."""
+    if not isinstance(groups, AsyncIterable):
+        groups = _iterate(groups)
+    succeeded = True
+    index = 0
+    async for group in groups:
         # Wait after sending each page except the last one
-        if pn != total_pages:
+        if index:
             await asyncio.sleep(duration)
+        index += 1
+        for packet in group:
+            succeeded = await dispatch_text_packet(manager, packet, delay) and succeeded
+    return succeeded
 
-    # After all pages, send the last page again with DISPLAY_COMPLETE status
-    screen_status = AIStatus.DISPLAY_COMPLETE
-    await send_text_packet(
-        manager=manager,
-        text_message=text,
-        page_number=total_pages,
-        max_pages=total_pages,
-        screen_status=screen_status,
-    )
 
+async def send_text(manager, text_message: str, duration: float = 5) -> str:
+    """Send text message to the glasses display."""
+    groups = build_text_packets(text_message)
+    if len(groups) > 1:
+        logger.info(f"Sending {len(groups)} pages with {duration} seconds delay")
+    await send_text_packets(manager, groups, duration)
     return text_message
 
 
+async def send_text_file(
+    manager, source: Union[str, Path, TextIO], duration: float = 5
+) -> bool:
+    """Page through a text file of any size without holding it in memory.
+
+    The file is read twice: once to count its pages, which every page
+    carries, then again while the pages are sent. Reading and layout run in
+    a worker thread, so the event loop keeps serving both arms meanwhile.
+    """
+    if not isinstance(source, (str, Path)):
+        # Streams are rewound for the second pass
+        start = source.tell()
+        total_pages = await asyncio.to_thread(count_pages, read_chunks(source))
+        source.seek(start)
+    else:
+        total_pages = await asyncio.to_thread(count_pages, read_chunks(source))
+    logger.info(f"Sending {total_pages} pages with {duration} seconds delay")
+    groups = _iter_text_packets_in_thread(iter_pages(read_chunks(source)), total_pages)
+    return await send_text_packets(manager, groups, duration)
+
+
+async def send_indexed_page(manager, index: PageIndex, page_number: int, delay: float = 0.4) -> bool:
+    """Show one page of an indexed document, e.g. to jump within a teleprompter script."""
+    packet = build_text_packet(
+        page_text(index.page(page_number)),
+        page_number,
+        len(index),
+        AIStatus.DISPLAYING | ScreenAction.NEW_CONTENT,
+    )
+    return await dispatch_text_packet(manager, packet, delay)
+
+
+class _PageStreamer:
+    """Keeps the page on display in step with a growing text, sending only what changed."""
+
+    def __init__(self, manager, report: StreamReport, delay: float):
+        self.manager = manager
+        self.report = report
+        self.delay = delay
+        self.text = ""
+        self.started_at: Optional[float] = None
+        # Start of the page on display in ``text``; pages before it are final
+        self._page_start = 0
+        self._page_number = 1
+        self._shown = ""
+        self._seq = 0
+
+    async def update(self, status: int = AIStatus.DISPLAYING, force: bool = False):
+        tail = self.text[self._page_start :]
+        located = list(iter_located_pages([tail]))
+        if not located:
+            return
+        encoded = tail.encode("utf-8")
+        for (_, lines), (next_start, _) in zip(located, located[1:]):
+            # The text overflowed this page: complete it, then move to the next one
+            await self._show("\n".join(lines), AIStatus.DISPLAYING)
+            self._page_number += 1
+            self._shown = ""
+        self._page_start += len(encoded[: located[-1][0]].decode("utf-8"))
+        await self._show("\n".join(located[-1][1]), status, force)
+
+    async def _show(self, page: str, status: int, force: bool = False) -> bool:
+        if page == self._shown and not force:
+            return True
+        page_bytes = page.encode("utf-8")
+        if self._shown and not force and page.startswith(self._shown):
+            # Appended text only, placed after what the glasses already show
+            position = len(self._shown.encode("utf-8"))
+        else:
+            position = 0
+        packet = encode_send_result(
+            page_bytes[position:],
+            seq=self._seq,
+            screen_status=status,
+            char_position=position,
+            page_number=self._page_number,
+            max_pages=self._page_number,
+        )
+        self._seq = (self._seq + 1) % 0x100
+        ok = await dispatch_text_packet(self.manager, packet, self.delay)
+        arms = sum(1 for glass in (self.manager.left_glass, self.manager.right_glass) if glass)
+        self.report.updates += 1
+        self.report.bytes_on_air += len(packet) * arms
+        self.report.pages = self._page_number
+        if ok:
+            self._shown = page
+            if self.report.time_to_first_glyph is None and self.started_at is not None:
+                self.report.time_to_first_glyph = time.perf_counter() - self.started_at
+        return ok
+
+
+async def stream_text(
+    manager, deltas: AsyncIterable[str], max_rate: float = 10.0, delay: float = 0.4
+) -> StreamReport:
+    """Show text while it is generated, e.g. token by token from a language model.
+
+    Deltas are coalesced into at most ``max_rate`` updates a second. An update
+    appending to the page on display carries only the new text, with its
+    offset in the page's UTF-8 text in ``new_char_pos0/1``; a page is resent
+    whole when rewrapping changed it, and the next page starts when the text
+    overflows. The last page is sent whole again with DISPLAY_COMPLETE.
+    """
+    report = StreamReport()
+    streamer = _PageStreamer(manager, report, delay)
+    received: List[str] = []
+    changed = asyncio.Event()
+    finished = False
+    started_at = time.perf_counter()
+
+    async def read():
+        nonlocal finished
+        try:
+            async for delta in deltas:
+                if not delta:
+                    continue
+                if streamer.started_at is None:
+                    streamer.started_at = time.perf_counter()
+                received.append(delta)
+                report.tokens += 1
+                changed.set()
+        finally:
+            finished = True
+            changed.set()
+
+    reader = asyncio.create_task(read())
+    interval = 1 / max_rate
+    try:
+        while not (finished and not received):
+            await changed.wait()
+            changed.clear()
+            if not received:
+                continue
+            streamer.text += "".join(received)
+            received.clear()
+            update_started_at = time.perf_counter()
+            await streamer.update()
+            # Let deltas pile up until the next update is due
+            await asyncio.sleep(max(0.0, interval - (time.perf_counter() - update_started_at)))
+        # Surface errors of the delta stream
+        await reader
+        await streamer.update(AIStatus.DISPLAY_COMPLETE, force=True)
+    finally:
+        if not reader.done():
+            reader.cancel()
+    report.elapsed = time.perf_counter() - started_at
+    logger.info(
+        f"Streamed {report.tokens} tokens in {report.updates} updates, "
+        f"{report.bytes_per_token:.1f} bytes per token"
+    )
+    return report
+
+
 def group_words(words: List[str], config: RSVPConfig) -> List[str]:
     """Group words according to configuration"""
     groups = []
@@ -154,17 +474,17 @@ def group_words(words: List[str], config: RSVPConfig) -> List[str]:
 async def send_rsvp(manager, text: str, config: RSVPConfig):
     """Display text using RSVP method with improved error handling"""
     if not text:
-        logging.warning("Empty text provided")
+        logger.warning("Empty text provided")
         return False
 
     try:
         # default delay is 01 second we are adding below to that so we need to calculate the delay
         screen_delay = 60 / config.wpm
-        logging.info(f"Words screen change delay: {screen_delay}")
+        logger.info(f"Words screen change delay: {screen_delay}")
         delay = min(screen_delay - 0.1, 0.1)  # Delay between words set min to 0.1
         words = text.split()
         if not words:
-            logging.warning("No words to display after splitting")
+            logger.warning("No words to display after splitting")
             return False
 
         # Add padding groups for initial display
@@ -178,7 +498,7 @@ async def send_rsvp(manager, text: str, config: RSVPConfig):
 
             success = await send_text(manager, group)
             if not success:
-                logging.error(f"Failed to display group: {group}")
+                logger.error(f"Failed to display group: {group}")
                 return False
 
             await asyncio.sleep(delay * config.words_per_group)
@@ -188,22 +508,44 @@ async def send_rsvp(manager, text: str, config: RSVPConfig):
         return True
 
     except asyncio.CancelledError:
-        logging.info("RSVP display cancelled")
+        logger.info("RSVP display cancelled")
         await send_text(manager, "--")  # Clear display on cancellation
         raise
     except Exception as e:
-        logging.error(f"Error in RSVP display: {e}")
+        logger.error(f"Error in RSVP display: {e}")
         await send_text(manager, "--")  # Try to clear display
         return False
 
 
 async def send_notification(manager, notification: NCSNotification):
     """Send a notification to the glasses."""
-    notification_chunks = await construct_notification(notification)
-    for chunk in notification_chunks:
-        await send_command_to_glasses(manager, chunk)
-        print(f"Sent chunk to glasses: {chunk}")
-        await asyncio.sleep(0.01)  # Small delay between chunks
+    max_chunk_size = manager.packet_budget(NOTIFICATION_CHUNK_HEADER, NOTIFICATION_CHUNK_SIZE)
+    notification_chunks = await construct_notification(notification, max_chunk_size)
+    await send_notification_chunks(manager, notification_chunks)
+
+
+async def send_notification_chunks(
+    manager, notification_chunks: List[bytes], ack_timeout: float = 0.1
+) -> bool:
+    """Send encoded notification chunks to the glasses in order.
+
+    Each arm gets the chunks back to back in one ``request_many`` batch and
+    acknowledges every one; ``ack_timeout`` bounds the wait after the last.
+    """
+
+    async def send_to_glass(glass) -> Optional[bool]:
+        replies = await glass.request_many(
+            notification_chunks, timeout=ack_timeout, priority=SendPriority.INTERACTIVE
+        )
+        if len(replies) < len(notification_chunks) or any(map(is_failure_reply, replies)):
+            return False
+        return None if None in replies else True
+
+    result = await manager.run_with_policy(
+        manager.policy_for(Command.NOTIFICATION), send_to_glass
+    )
+    logger.info(f"Sent {len(notification_chunks)} notification chunks to glasses")
+    return result.succeeded
 
 
 async def execute_command(manager, construct_func, *args, log_message: str = ""):
@@ -211,7 +553,7 @@ async def execute_command(manager, construct_func, *args, log_message: str = "")
     command = construct_func(*args)
     await send_command_to_glasses(manager, command)
     if log_message:
-        logging.info(log_message)
+        logger.info(log_message)
 
 
 async def show_dashboard(manager, position: int):
@@ -289,14 +631,9 @@ async def delete_note(manager, note_number: int):
     )
 
 
-async def send_command_to_glasses(manager, command):
-    """Helper function to send a command to the glasses."""
-    if manager.left_glass:
-        await manager.left_glass.send(command)
-        await asyncio.sleep(0.1)
-    if manager.right_glass:
-        await manager.right_glass.send(command)
-        await asyncio.sleep(0.1)
+async def send_command_to_glasses(manager, command, ack_timeout: float = 0.1) -> DispatchResult:
+    """Helper function to send a command to the glasses following its dispatch policy."""
+    return await manager.dispatch(command, ack_timeout=ack_timeout)
 
 
 async def apply_glasses_wear(manager, status: GlassesWearStatus):
@@ -308,24 +645,19 @@ async def apply_glasses_wear(manager, status: GlassesWearStatus):
         log_message=f"Glasses wear detection set to {status.name}."
     )
 
-async def send_image(manager, image_data: bytes):
+async def send_image(manager, image_data: bytes) -> DispatchResult:
     """Send image data to the glasses using optimized functions."""
-    # Divide image data into packets using NumPy
-    packets_array = divide_image_data(image_data)
-
-    # Preconstruct all data packets using list comprehension
-    data_packets = [
-        construct_bmp_data_packet(seq, packet_array, seq == 0)
-        for seq, packet_array in enumerate(packets_array)
-    ]
-
-    # Concatenate image data for CRC
-    full_image_array = np.concatenate(packets_array)
-
-    # Send data to left glass first
-    if manager.left_glass:
-        await send_data_to_glass(manager.left_glass, data_packets, full_image_array)
-
-    # Send data to right glass after acknowledgment from left
-    if manager.right_glass:
-        await send_data_to_glass(manager.right_glass, data_packets, full_image_array)
\ No newline at end of file
+    data_packets_by_size = {}
+
+    async def send_to_glass(glass):
+        # Each arm gets packets sized to its own MTU
+        packet_size = glass.packet_budget(IMAGE_PACKET_HEADER, IMAGE_PACKET_SIZE)
+        if packet_size not in data_packets_by_size:
+            data_packets_by_size[packet_size] = encode_bmp_packets(image_data, packet_size)
+        # CRC covers the whole image whatever the packet size
+        return await send_data_to_glass(glass, data_packets_by_size[packet_size], image_data)
+
+    # Both arms take the image independently, see DISPATCH_POLICIES
+    return await manager.run_with_policy(
+        manager.policy_for(Command.BMP_DATA), send_to_glass
+    )
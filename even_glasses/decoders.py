@@ -0,0 +1,145 @@
+from typing import List, Optional, Type, Union
+
+from even_glasses.models import Command, MicStatus, ResponseStatus
+
+# Typed views of packets received from the glasses. A view reads its fields
+# in place from a memoryview of the notification buffer, so payloads such as
+# mic audio are never copied; call ``bytes()`` on a payload to keep it.
+
+
+class InboundPacket:
+    """A received packet, its fields read on access."""
+
+    __slots__ = ("data",)
+    MIN_LENGTH = 1
+
+    def __init__(self, data: memoryview):
+        self.data = data
+
+    @property
+    def command(self) -> int:
+        return self.data[0]
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, index):
+        """Byte or slice of the packet, for handlers written against raw bytes."""
+        return self.data[index]
+
+    def __bytes__(self) -> bytes:
+        return self.data.tobytes()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(0x{self.command:02X}, {len(self.data)} bytes)"
+
+
+class HeartbeatEcho(InboundPacket):
+    __slots__ = ()
+
+    @property
+    def seq(self) -> Optional[int]:
+        return self.data[3] if len(self.data) > 3 else None
+
+
+class AIEvent(InboundPacket):
+    """START_AI event: touchpad taps, Even AI start and stop, wear detection."""
+
+    __slots__ = ()
+    MIN_LENGTH = 2
+
+    @property
+    def sub_command(self) -> int:
+        return self.data[1]
+
+    @property
+    def param(self) -> memoryview:
+        return self.data[2:]
+
+
+class MicResponse(InboundPacket):
+    __slots__ = ()
+    MIN_LENGTH = 3
+
+    @property
+    def status(self) -> int:
+        return self.data[1]
+
+    @property
+    def ok(self) -> bool:
+        return self.data[1] == ResponseStatus.SUCCESS
+
+    @property
+    def enabled(self) -> bool:
+        return self.data[2] == MicStatus.ENABLE
+
+
+class MicFrame(InboundPacket):
+    """LC3 audio from the right arm's microphone."""
+
+    __slots__ = ()
+    MIN_LENGTH = 2
+
+    @property
+    def seq(self) -> int:
+        return self.data[1]
+
+    @property
+    def audio(self) -> memoryview:
+        return self.data[2:]
+
+
+class SendResultAck(InboundPacket):
+    __slots__ = ()
+    MIN_LENGTH = 2
+
+    @property
+    def status(self) -> int:
+        return self.data[1]
+
+    @property
+    def ok(self) -> bool:
+        return self.data[1] == ResponseStatus.SUCCESS
+
+
+class NotificationChunk(InboundPacket):
+    __slots__ = ()
+    MIN_LENGTH = 4
+
+    @property
+    def notify_id(self) -> int:
+        return self.data[1]
+
+    @property
+    def total_chunks(self) -> int:
+        return self.data[2]
+
+    @property
+    def index(self) -> int:
+        return self.data[3]
+
+    @property
+    def content(self) -> memoryview:
+        return self.data[4:]
+
+
+# View class by command byte; None for bytes that are no known command
+DECODERS: List[Optional[Type[InboundPacket]]] = [None] * 256
+for _command in Command:
+    DECODERS[_command] = InboundPacket
+DECODERS[Command.HEARTBEAT] = HeartbeatEcho
+DECODERS[Command.START_AI] = AIEvent
+DECODERS[Command.MIC_RESPONSE] = MicResponse
+DECODERS[Command.RECEIVE_MIC_DATA] = MicFrame
+DECODERS[Command.SEND_RESULT] = SendResultAck
+DECODERS[Command.NOTIFICATION] = NotificationChunk
+
+
+def decode(data: Union[bytes, bytearray, memoryview]) -> Optional[InboundPacket]:
+    """View of a received packet, None if it is empty, of no known command or too short."""
+    if not data:
+        return None
+    view_class = DECODERS[data[0]]
+    if view_class is None or len(data) < view_class.MIN_LENGTH:
+        return None
+    return view_class(memoryview(data))
@@ -0,0 +1,163 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional, Tuple, Union
+
+from even_glasses.decoders import DECODERS, InboundPacket
+from even_glasses.models import OverflowPolicy
+
+logger = logging.getLogger(__name__)
+
+# Commands an event subscription receives: one command byte, several, or
+# None for every packet
+EventFilter = Union[None, int, Iterable[int]]
+
+
+class Event:
+    """A packet received from one arm, tagged with the arm it came from.
+
+    ``packet`` is the view ``decoders`` has for the command, with all of its
+    fields; packets of unknown commands are plain ``InboundPacket`` views.
+    """
+
+    __slots__ = ("side", "packet", "timestamp")
+
+    def __init__(self, side: str, packet: InboundPacket, timestamp: float):
+        self.side = side
+        self.packet = packet
+        self.timestamp = timestamp
+
+    @property
+    def command(self) -> int:
+        return self.packet.command
+
+    def __repr__(self) -> str:
+        return f"Event({self.side}, {self.packet!r})"
+
+
+class EventSubscription:
+    """Events for one consumer, iterated with ``async for``.
+
+    Each subscription buffers up to ``maxsize`` events of its own, so a slow
+    consumer only loses its own events, oldest or newest first depending on
+    ``overflow``. Iteration ends once the subscription is closed and drained.
+    """
+
+    def __init__(
+        self,
+        filter: EventFilter = None,
+        maxsize: int = 256,
+        overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ):
+        if overflow == OverflowPolicy.BLOCK:
+            raise ValueError("Events are published from the notify callback, which cannot block")
+        if filter is None:
+            self.commands: Optional[frozenset] = None
+        elif isinstance(filter, int):
+            self.commands = frozenset((int(filter),))
+        else:
+            self.commands = frozenset(int(command) for command in filter)
+        if self.commands is not None:
+            invalid = sorted(command for command in self.commands if not 0 <= command <= 0xFF)
+            if invalid:
+                raise ValueError(f"Event filter commands must be bytes, got {invalid}")
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.received = 0
+        self.dropped = 0
+        self.closed = False
+        self._buffer: Deque[Event] = deque()
+        # Created by the first wait, in the loop that iterates; Python 3.9
+        # ties an event to the loop current when it is built
+        self._ready: Optional[asyncio.Event] = None
+        self._hubs: List["EventHub"] = []
+
+    def _push(self, event: Event):
+        self.received += 1
+        if len(self._buffer) >= self.maxsize:
+            self.dropped += 1
+            if self.overflow == OverflowPolicy.DROP_NEWEST:
+                return
+            self._buffer.popleft()
+        self._buffer.append(event)
+        if self._ready is not None:
+            self._ready.set()
+
+    def __aiter__(self) -> "EventSubscription":
+        return self
+
+    async def __anext__(self) -> Event:
+        while not self._buffer:
+            if self.closed:
+                raise StopAsyncIteration
+            if self._ready is None:
+                self._ready = asyncio.Event()
+            self._ready.clear()
+            await self._ready.wait()
+        return self._buffer.popleft()
+
+    def close(self):
+        for hub in list(self._hubs):
+            hub.unsubscribe(self)
+        self.closed = True
+        if self._ready is not None:
+            self._ready.set()
+
+    async def __aenter__(self) -> "EventSubscription":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+    def snapshot(self) -> Dict:
+        return {
+            "depth": len(self._buffer),
+            "maxsize": self.maxsize,
+            "received": self.received,
+            "dropped": self.dropped,
+        }
+
+
+class EventHub:
+    """Fans the packets of one arm out to the subscriptions that want their command.
+
+    Subscriptions are indexed by command byte, so a packet nobody subscribed
+    to costs one list lookup and is never decoded. A packet too short for
+    its command's view is counted in ``malformed`` and not published.
+    """
+
+    def __init__(self, side: str):
+        self.side = side
+        self.by_command: List[Tuple[EventSubscription, ...]] = [()] * 256
+        self.malformed = 0
+
+    def subscribe(self, subscription: EventSubscription):
+        commands = range(256) if subscription.commands is None else subscription.commands
+        for command in commands:
+            if subscription not in self.by_command[command]:
+                self.by_command[command] += (subscription,)
+        subscription._hubs.append(self)
+
+    def unsubscribe(self, subscription: EventSubscription):
+        for command, subscriptions in enumerate(self.by_command):
+            if subscription in subscriptions:
+                self.by_command[command] = tuple(s for s in subscriptions if s is not subscription)
+        if self in subscription._hubs:
+            subscription._hubs.remove(self)
+
+    def publish(self, data: Union[bytes, bytearray]):
+        subscriptions = self.by_command[data[0]]
+        if not subscriptions:
+            return
+        view_class = DECODERS[data[0]] or InboundPacket
+        if len(data) < view_class.MIN_LENGTH:
+            self.malformed += 1
+            logger.debug(
+                "Not publishing a %d byte 0x%02X packet of the %s arm", len(data), data[0], self.side
+            )
+            return
+        packet = view_class(memoryview(data))
+        event = Event(self.side, packet, time.time())
+        for subscription in subscriptions:
+            subscription._push(event)
@@ -0,0 +1,240 @@
+import asyncio
+import logging
+import re
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from bleak import BleakScanner
+from pydantic import BaseModel, Field
+
+from even_glasses.bluetooth_manager import GlassesManager, Glass, glass_side
+from even_glasses.models import DesiredConnectionState
+from even_glasses.service_identifiers import UART_SERVICE_UUID
+from even_glasses.transport import Transport
+
+logger = logging.getLogger(__name__)
+
+# Advertised names look like "Even G1_45_L_1A2B3C": both arms of a pair share
+# the serial between the model prefix and the side marker.
+PAIR_SERIAL_PATTERN = re.compile(r"G1_([0-9A-Za-z]+)_[LR]_")
+
+
+def pair_serial(device_name: str) -> Optional[str]:
+    """Serial shared by both arms of a pair, None if the name is not a G1 arm."""
+    if glass_side(device_name) is None:
+        return None
+    match = PAIR_SERIAL_PATTERN.search(device_name)
+    if match:
+        return match.group(1)
+    # Unknown naming scheme: the name without its side marker
+    return device_name.replace("_L_", "_").replace("_R_", "_")
+
+
+class PairStatus(BaseModel):
+    serial: str
+    left_address: Optional[str] = Field(default=None)
+    right_address: Optional[str] = Field(default=None)
+    left_connected: bool = Field(default=False)
+    right_connected: bool = Field(default=False)
+    left_srtt: Optional[float] = Field(default=None, description="Smoothed heartbeat RTT in seconds")
+    right_srtt: Optional[float] = Field(default=None, description="Smoothed heartbeat RTT in seconds")
+    last_error: Optional[str] = Field(default=None)
+
+    @property
+    def state(self) -> str:
+        if self.left_connected and self.right_connected:
+            return "connected"
+        if self.left_connected or self.right_connected:
+            return "degraded"
+        return "disconnected"
+
+
+class FleetManager:
+    """Discovers, pairs, connects and supervises many glasses pairs from one event loop.
+
+    Every connection attempt, including reconnects, takes one of
+    ``max_concurrent_connects`` slots since adapters choke on simultaneous
+    connects. Each arm connects in its own task with a deadline, so one
+    stalled pair never holds up the others.
+    """
+
+    def __init__(
+        self,
+        max_concurrent_connects: int = 2,
+        connect_timeout: float = 20.0,
+        transport_factory: Optional[Callable[[str], Transport]] = None,
+        pipelined: bool = False,
+    ):
+        self.connect_timeout = connect_timeout
+        self.transport_factory = transport_factory
+        self.pipelined = pipelined
+        self.managers: Dict[str, GlassesManager] = {}
+        self.max_concurrent_connects = max_concurrent_connects
+        # Created in the running loop on first use
+        self._connect_slots: Optional[asyncio.Semaphore] = None
+        self._errors: Dict[str, str] = {}
+        self._supervisor_task: Optional[asyncio.Task] = None
+
+    def add_pair(
+        self,
+        serial: str,
+        left: Optional[Tuple[str, str]] = None,
+        right: Optional[Tuple[str, str]] = None,
+    ) -> GlassesManager:
+        """Register a pair from (name, address) tuples of its arms."""
+        manager = self.managers.get(serial)
+        if manager is None:
+            manager = GlassesManager(
+                transport_factory=self.transport_factory, pipelined=self.pipelined
+            )
+            self.managers[serial] = manager
+        for side, arm in (("left", left), ("right", right)):
+            if arm and manager._glass_for_side(side) is None:
+                name, address = arm
+                glass = manager._create_glass(name, address, side)
+                glass.connect_timeout = self.connect_timeout
+                setattr(manager, f"{side}_glass", glass)
+        return manager
+
+    async def scan(
+        self,
+        timeout: float = 10,
+        expected_pairs: Optional[int] = None,
+        filter_uart_service: bool = False,
+    ) -> List[str]:
+        """Discover arms and group them into pairs by serial.
+
+        Stops early once ``expected_pairs`` complete pairs were seen. Returns
+        the serials of the pairs found.
+        """
+        arms: Dict[str, Dict[str, Tuple[str, str]]] = {}
+        enough = asyncio.Event()
+
+        def complete_pairs() -> int:
+            return sum(1 for sides in arms.values() if len(sides) == 2)
+
+        def on_detection(device, advertisement_data):
+            device_name = device.name or advertisement_data.local_name or ""
+            serial = pair_serial(device_name)
+            if serial is None:
+                return
+            sides = arms.setdefault(serial, {})
+            side = glass_side(device_name)
+            if side not in sides:
+                logger.info(f"Found {side} arm of pair {serial}: {device.address}")
+                sides[side] = (device_name, device.address)
+                if expected_pairs and complete_pairs() >= expected_pairs:
+                    enough.set()
+
+        scanner = BleakScanner(
+            detection_callback=on_detection,
+            service_uuids=[UART_SERVICE_UUID] if filter_uart_service else None,
+        )
+        await scanner.start()
+        try:
+            await asyncio.wait_for(enough.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            await scanner.stop()
+
+        for serial, sides in arms.items():
+            self.add_pair(serial, sides.get("left"), sides.get("right"))
+        logger.info(f"Found {len(arms)} pairs, {complete_pairs()} complete")
+        return list(arms)
+
+    def _slots(self) -> asyncio.Semaphore:
+        if self._connect_slots is None:
+            self._connect_slots = asyncio.Semaphore(self.max_concurrent_connects)
+        return self._connect_slots
+
+    async def _connect_glass(self, serial: str, glass: Glass) -> bool:
+        # connect_timeout applies from when the arm gets a connect slot
+        glass.connect_slots = self._slots()
+        try:
+            await glass.connect()
+            return True
+        except Exception as e:
+            message = str(e) or type(e).__name__
+            self._errors[serial] = f"{glass.side}: {message}"
+            logger.error(f"Could not connect {glass.side} arm of pair {serial}: {message}")
+            return False
+
+    async def connect_all(self) -> Dict[str, bool]:
+        """Connect every arm of every pair; True per serial when both arms connected."""
+        attempts = []
+        for serial, manager in self.managers.items():
+            for glass in (manager.left_glass, manager.right_glass):
+                if glass and not glass.is_connected:
+                    attempts.append((serial, self._connect_glass(serial, glass)))
+        await asyncio.gather(*(attempt for _, attempt in attempts))
+        return {serial: self.status(serial).state == "connected" for serial in self.managers}
+
+    async def scan_and_connect(
+        self, timeout: float = 10, expected_pairs: Optional[int] = None
+    ) -> Dict[str, bool]:
+        await self.scan(timeout=timeout, expected_pairs=expected_pairs)
+        return await self.connect_all()
+
+    def status(self, serial: str) -> PairStatus:
+        manager = self.managers[serial]
+        left, right = manager.left_glass, manager.right_glass
+        return PairStatus(
+            serial=serial,
+            left_address=left.address if left else None,
+            right_address=right.address if right else None,
+            left_connected=bool(left and left.is_connected),
+            right_connected=bool(right and right.is_connected),
+            left_srtt=left.link_quality.srtt if left else None,
+            right_srtt=right.link_quality.srtt if right else None,
+            last_error=self._errors.get(serial),
+        )
+
+    def statuses(self) -> List[PairStatus]:
+        return [self.status(serial) for serial in self.managers]
+
+    def health(self) -> Dict[str, int]:
+        """Number of pairs per state across the fleet."""
+        counts = {"pairs": len(self.managers), "connected": 0, "degraded": 0, "disconnected": 0}
+        for status in self.statuses():
+            counts[status.state] += 1
+        return counts
+
+    def start_supervision(self, interval: float = 5.0):
+        """Periodically restart reconnects of arms whose own supervisor gave up."""
+        if self._supervisor_task is None or self._supervisor_task.done():
+            self._supervisor_task = asyncio.create_task(self._supervise(interval))
+
+    async def _supervise(self, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            started_at = time.perf_counter()
+            restarted = 0
+            for manager in self.managers.values():
+                for glass in (manager.left_glass, manager.right_glass):
+                    if not glass or glass.is_connected:
+                        continue
+                    # Arms disconnected on purpose stay down
+                    if glass.desired_connection_state != DesiredConnectionState.CONNECTED:
+                        continue
+                    # Joins the arm's reconnect task if it is still running
+                    glass.connect_slots = self._slots()
+                    glass.start_reconnect()
+                    restarted += 1
+            if restarted:
+                logger.info(
+                    f"Fleet supervision: {restarted} arms reconnecting "
+                    f"(checked in {(time.perf_counter() - started_at) * 1000:.1f} ms)"
+                )
+
+    async def disconnect_all(self):
+        if self._supervisor_task:
+            self._supervisor_task.cancel()
+            try:
+                await self._supervisor_task
+            except asyncio.CancelledError:
+                pass
+            self._supervisor_task = None
+        await asyncio.gather(
+            *(manager.disconnect_all() for manager in self.managers.values())
+        )
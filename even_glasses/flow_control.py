@@ -0,0 +1,63 @@
+import asyncio
+from collections import deque
+from typing import Deque
+
+# Bytes a BLE controller can typically queue for one link before writes
+# without response start failing; the window keeps about this much in flight.
+PIPELINE_BUFFER_BYTES = 2048
+MIN_WINDOW = 2
+MAX_WINDOW = 16
+
+
+def window_for_mtu(mtu: int) -> int:
+    """Number of writes to keep in flight for a link with the given ATT MTU."""
+    payload = max(mtu - 3, 20)
+    return max(MIN_WINDOW, min(MAX_WINDOW, PIPELINE_BUFFER_BYTES // payload))
+
+
+class WriteWindow:
+    """Bounds the writes in flight on a link.
+
+    The limit is halved whenever a write fails and grows back by one after a
+    full window of successful writes, up to the size it was created with.
+    """
+
+    def __init__(self, limit: int):
+        self.maximum = limit
+        self.limit = limit
+        self.in_flight = 0
+        self._successes = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    async def acquire(self):
+        if self.in_flight < self.limit and not self._waiters:
+            self.in_flight += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just before cancellation
+                self.release(success=True)
+            else:
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self, success: bool):
+        self.in_flight -= 1
+        if success:
+            self._successes += 1
+            if self._successes >= self.limit and self.limit < self.maximum:
+                self.limit += 1
+                self._successes = 0
+        else:
+            self.limit = max(1, self.limit // 2)
+            self._successes = 0
+
+        while self._waiters and self.in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
@@ -0,0 +1,202 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, List, Optional, Tuple, Union
+from uuid import UUID
+
+from even_glasses.metrics import Histogram
+from even_glasses.models import Command, OverflowPolicy
+
+logger = logging.getLogger(__name__)
+
+Sender = Union[UUID, int, str]
+Deliver = Callable[[Sender, bytes], Awaitable[None]]
+
+# What happens to an inbound packet of each command when its device's queue
+# is full. Mic audio is only useful fresh, while a lost tap or wear event
+# would leave the application out of step with the glasses.
+OVERFLOW_POLICIES: Dict[int, OverflowPolicy] = {
+    Command.RECEIVE_MIC_DATA: OverflowPolicy.DROP_OLDEST,
+    Command.START_AI: OverflowPolicy.BLOCK,
+}
+
+
+class InboundQueue:
+    """Bounded queue between a device's notify callback and its packet handler.
+
+    ``put`` returns as soon as the packet is queued, so a slow handler never
+    stalls delivery; worker tasks hand packets to ``deliver`` in the order
+    they were queued. That is arrival order only while the queue has room: a
+    packet that waited for room may be queued behind later ones, and with
+    several workers overlapping handlers finish in any order. When the queue
+    holds ``maxsize`` packets, the policy of the incoming packet's command
+    decides which one gives way, see ``OVERFLOW_POLICIES``.
+    """
+
+    def __init__(
+        self,
+        deliver: Deliver,
+        maxsize: int = 256,
+        workers: int = 1,
+        policies: Optional[Dict[int, OverflowPolicy]] = None,
+        default_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        name: str = "device",
+    ):
+        self.deliver = deliver
+        self.maxsize = maxsize
+        self.workers = workers
+        self.policies = dict(OVERFLOW_POLICIES if policies is None else policies)
+        self.default_policy = default_policy
+        self.name = name
+        # Arrival time, sender and packet
+        self._queue: Deque[Tuple[float, Sender, bytes]] = deque()
+        # Created in the running loop by _bind, as Python 3.9 ties an event to
+        # the loop current when it is built
+        self._not_empty: Optional[asyncio.Event] = None
+        self._not_full: Optional[asyncio.Event] = None
+        # Set while no packet is queued or being handled
+        self._idle: Optional[asyncio.Event] = None
+        self._active = 0
+        self._tasks: List[asyncio.Task] = []
+        # Bumped by ``stop``, so puts still waiting for room give up
+        self._generation = 0
+        self.max_depth = 0
+        self.delivered = 0
+        self.handler_errors = 0
+        self.dropped: Dict[int, int] = {}
+        self.queue_wait = Histogram()
+        self.handler_latency = Histogram()
+
+    @property
+    def depth(self) -> int:
+        return len(self._queue)
+
+    def policy_for(self, command: Optional[int]) -> OverflowPolicy:
+        return self.policies.get(command, self.default_policy)
+
+    async def put(self, sender: Sender, data: bytes):
+        """Queue a packet for the handler, making room first if the queue is full."""
+        self._start()
+        generation = self._generation
+        command = data[0] if data else None
+        while len(self._queue) >= self.maxsize:
+            policy = self.policy_for(command)
+            if policy == OverflowPolicy.DROP_NEWEST:
+                self._count_drop(command)
+                return
+            # Any policy takes the place of the oldest packet that may be dropped
+            if self._drop_oldest_droppable():
+                break
+            if policy == OverflowPolicy.DROP_OLDEST:
+                # Only undroppable packets are queued, the new one gives way
+                self._count_drop(command)
+                return
+            self._not_full.clear()
+            await self._not_full.wait()
+            if generation != self._generation:
+                # The queue was stopped while this packet waited for room
+                self._count_drop(command)
+                return
+        self._queue.append((time.perf_counter(), sender, data))
+        self._idle.clear()
+        if len(self._queue) > self.max_depth:
+            self.max_depth = len(self._queue)
+        self._not_empty.set()
+
+    def _drop_oldest_droppable(self) -> bool:
+        for index, (_, _, data) in enumerate(self._queue):
+            command = data[0] if data else None
+            if self.policy_for(command) == OverflowPolicy.DROP_OLDEST:
+                del self._queue[index]
+                self._count_drop(command)
+                return True
+        return False
+
+    def _count_drop(self, command: Optional[int]):
+        self.dropped[command] = self.dropped.get(command, 0) + 1
+        if command is not None:
+            logger.debug("Dropped inbound 0x%02X packet of %s", command, self.name)
+
+    def _bind(self):
+        if self._idle is not None:
+            return
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._not_full.set()
+        self._idle = asyncio.Event()
+        if not self._queue and not self._active:
+            self._idle.set()
+
+    def _start(self):
+        self._bind()
+        if self._tasks:
+            return
+        self._tasks = [asyncio.create_task(self._work()) for _ in range(self.workers)]
+
+    async def _work(self):
+        while True:
+            while not self._queue:
+                self._not_empty.clear()
+                await self._not_empty.wait()
+            queued_at, sender, data = self._queue.popleft()
+            self._not_full.set()
+            self._active += 1
+            started_at = time.perf_counter()
+            self.queue_wait.record(started_at - queued_at)
+            try:
+                await self.deliver(sender, data)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.handler_errors += 1
+                logger.error(f"Handler of {self.name} failed on a 0x{data[0]:02X} packet: {e}")
+            finally:
+                self._active -= 1
+                if not self._queue and not self._active:
+                    self._idle.set()
+            self.delivered += 1
+            self.handler_latency.record(time.perf_counter() - started_at)
+
+    async def join(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued packet was handed to the handler; False on timeout."""
+        self._bind()
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def stop(self):
+        """Stop the workers and drop the packets still queued or waiting for room.
+
+        The queue starts again with the next ``put``.
+        """
+        self._bind()
+        self._generation += 1
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        while self._queue:
+            _, _, data = self._queue.popleft()
+            self._count_drop(data[0] if data else None)
+        self._active = 0
+        self._idle.set()
+        # Wake blocked puts, which see the new generation and drop their packet
+        self._not_full.set()
+
+    def snapshot(self) -> Dict:
+        return {
+            "depth": len(self._queue),
+            "max_depth": self.max_depth,
+            "maxsize": self.maxsize,
+            "delivered": self.delivered,
+            "handler_errors": self.handler_errors,
+            "dropped": {
+                (f"0x{command:02X}" if command is not None else "empty"): count
+                for command, count in self.dropped.items()
+            },
+            "queue_wait": self.queue_wait.snapshot(),
+            "handler_latency": self.handler_latency.snapshot(),
+        }
@@ -0,0 +1,316 @@
+import re
+import unicodedata
+from functools import lru_cache
+from pathlib import Path
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
+
+from even_glasses.utils import SEND_RESULT_PAYLOAD_SIZE
+
+# Pixels of the 640 px display available to a line of text; the 40
+# average-width characters the layout used to wrap at fill it
+LINE_WIDTH = 488
+LINES_PER_PAGE = 5
+
+# Approximate advance widths in pixels of printable ASCII in the proportional
+# G1 font; lines are packed against these, so tune them if text clips
+ASCII_ADVANCES = {
+    " ": 6, "!": 5, '"': 8, "#": 14, "$": 12, "%": 17, "&": 15, "'": 4,
+    "(": 7, ")": 7, "*": 10, "+": 13, ",": 5, "-": 8, ".": 5, "/": 9,
+    "0": 12, "1": 12, "2": 12, "3": 12, "4": 12, "5": 12, "6": 12, "7": 12,
+    "8": 12, "9": 12, ":": 5, ";": 5, "<": 13, "=": 13, ">": 13, "?": 10,
+    "@": 19, "A": 14, "B": 13, "C": 13, "D": 14, "E": 12, "F": 11, "G": 14,
+    "H": 15, "I": 6, "J": 9, "K": 13, "L": 11, "M": 18, "N": 15, "O": 15,
+    "P": 12, "Q": 15, "R": 13, "S": 12, "T": 12, "U": 14, "V": 14, "W": 19,
+    "X": 13, "Y": 13, "Z": 12, "[": 7, "\\": 9, "]": 7, "^": 12, "_": 10,
+    "`": 7, "a": 11, "b": 12, "c": 10, "d": 12, "e": 11, "f": 7, "g": 12,
+    "h": 12, "i": 5, "j": 5, "k": 11, "l": 5, "m": 18, "n": 12, "o": 12,
+    "p": 12, "q": 12, "r": 8, "s": 10, "t": 7, "u": 12, "v": 11, "w": 16,
+    "x": 11, "y": 11, "z": 10, "{": 7, "|": 5, "}": 7, "~": 13,
+}
+DEFAULT_ADVANCE = 12  # Other narrow glyphs: accented Latin, Greek, Cyrillic
+WIDE_ADVANCE = 21  # CJK, fullwidth forms and emoji
+
+
+@lru_cache(maxsize=4096)
+def advance(char: str) -> int:
+    """Advance width of a character in pixels."""
+    width = ASCII_ADVANCES.get(char)
+    if width is not None:
+        return width
+    if unicodedata.combining(char) or unicodedata.category(char) in ("Mn", "Me", "Cf"):
+        return 0
+    if unicodedata.east_asian_width(char) in ("W", "F") or ord(char) >= 0x1F000:
+        return WIDE_ADVANCE
+    return DEFAULT_ADVANCE
+
+
+def text_width(text: str) -> int:
+    return sum(map(advance, text))
+
+
+def _segments(word: str, continued: bool = False) -> Tuple[Tuple[str, bool, int, int], ...]:
+    """Split a word where lines may break, wide glyphs being breakable on both sides.
+
+    Each segment comes with whether it is glued to the previous one without a
+    space, the first one being when the word ``continued`` a piece fed before
+    it, its width and its UTF-8 length.
+    """
+    segments = []
+    run_start = 0
+    for index, char in enumerate(word):
+        if advance(char) == WIDE_ADVANCE:
+            if run_start < index:
+                segments.append(word[run_start:index])
+            segments.append(char)
+            run_start = index + 1
+    if run_start < len(word):
+        segments.append(word[run_start:])
+    return tuple(
+        (segment, index > 0 or continued, text_width(segment), len(segment.encode("utf-8")))
+        for index, segment in enumerate(segments)
+    )
+
+
+# Natural text repeats the same words; long ones are rare and not worth keeping
+_cached_segments = lru_cache(maxsize=65536)(_segments)
+CACHED_WORD_CHARS = 32
+
+
+class LineWrapper:
+    """Greedily packs words into lines of at most ``line_width`` pixels, one word at a time.
+
+    Completed lines come with the UTF-8 offset of their first character in
+    the text, given the ``position`` of each word added.
+    """
+
+    def __init__(self, line_width: int = LINE_WIDTH):
+        self.line_width = line_width
+        self._space = advance(" ")
+        self._line: List[str] = []
+        self._line_start = 0
+        self._width = 0
+
+    def add_word(self, word: str, continued: bool = False, position: int = 0) -> List[Tuple[int, str]]:
+        """Add a word, or the next piece of one if ``continued``; returns completed lines."""
+        lines = []
+        if len(word) <= CACHED_WORD_CHARS:
+            segments = _cached_segments(word, continued)
+        else:
+            segments = _segments(word, continued)
+        for index, (segment, glued, segment_width, segment_bytes) in enumerate(segments):
+            gap = 0 if glued or not self._line else self._space
+            if self._line and self._width + gap + segment_width <= self.line_width:
+                if gap:
+                    self._line.append(" ")
+                self._line.append(segment)
+                self._width += gap + segment_width
+                position += segment_bytes
+                continue
+            # Lines break between segments, except inside a word fed in pieces
+            if self._line and not (index == 0 and continued):
+                lines.append((self._line_start, "".join(self._line)))
+                self._line, self._width = [], 0
+            if not self._line and segment_width <= self.line_width:
+                self._line, self._width, self._line_start = [segment], segment_width, position
+                position += segment_bytes
+                continue
+            # A word wider than what is left of the line is broken between characters
+            for char in segment:
+                char_width = advance(char)
+                if self._line and self._width + char_width > self.line_width:
+                    lines.append((self._line_start, "".join(self._line)))
+                    self._line, self._width = [], 0
+                if not self._line:
+                    self._line_start = position
+                self._line.append(char)
+                self._width += char_width
+                position += len(char.encode("utf-8"))
+        return lines
+
+    def end_paragraph(self) -> List[Tuple[int, str]]:
+        if not self._line:
+            return []
+        line = (self._line_start, "".join(self._line))
+        self._line, self._width = [], 0
+        return [line]
+
+
+def wrap_paragraph(paragraph: str, line_width: int = LINE_WIDTH) -> List[str]:
+    """Greedily pack the words of a paragraph into lines of at most ``line_width`` pixels."""
+    wrapper = LineWrapper(line_width)
+    lines = []
+    for word in paragraph.split():
+        lines.extend(line for _, line in wrapper.add_word(word))
+    lines.extend(line for _, line in wrapper.end_paragraph())
+    return lines
+
+
+# Longest run of text without whitespace kept across chunks before it is
+# laid out as a partial word, which bounds memory on inputs without spaces
+MAX_WORD_CHARS = 1024
+_TOKENS = re.compile(r"\n|[^\S\n]+|\S+")
+
+LocatedPage = Tuple[int, Tuple[str, ...]]
+
+
+class Paginator:
+    """Lays out text fed in chunks of any size into pages, in linear time and bounded memory.
+
+    ``feed`` and ``close`` return the pages completed so far; only the page
+    being filled and the word cut by a chunk boundary are kept in between.
+    Their ``_located`` variants also give the UTF-8 offset in the text where
+    each page starts.
+    """
+
+    def __init__(
+        self,
+        line_width: int = LINE_WIDTH,
+        lines_per_page: int = LINES_PER_PAGE,
+        max_page_bytes: Optional[int] = SEND_RESULT_PAYLOAD_SIZE,
+    ):
+        self.lines_per_page = lines_per_page
+        self.max_page_bytes = max_page_bytes
+        self._wrapper = LineWrapper(line_width)
+        self._pending = ""
+        self._continued = False
+        # UTF-8 offset of the first character not laid out yet
+        self._position = 0
+        self._page: List[str] = []
+        self._page_start = 0
+        # Pages are padded to full height, so every page carries its separators
+        self._page_bytes = lines_per_page - 1
+
+    def feed(self, chunk: str) -> List[Tuple[str, ...]]:
+        return [page for _, page in self.feed_located(chunk)]
+
+    def close(self) -> List[Tuple[str, ...]]:
+        return [page for _, page in self.close_located()]
+
+    def feed_located(self, chunk: str) -> List[LocatedPage]:
+        pages: List[LocatedPage] = []
+        if self._pending:
+            chunk = self._pending + chunk
+            self._pending = ""
+        tokens = _TOKENS.findall(chunk)
+        # The last word may continue in the next chunk
+        last = tokens.pop() if tokens and not tokens[-1].isspace() else None
+        for token in tokens:
+            self._add_token(token, pages)
+        if last is not None:
+            if len(last) > MAX_WORD_CHARS:
+                self._add_token(last, pages)
+                self._continued = True
+            else:
+                self._pending = last
+        return pages
+
+    def close_located(self) -> List[LocatedPage]:
+        pages: List[LocatedPage] = []
+        if self._pending:
+            self._add_token(self._pending, pages)
+            self._pending = ""
+        self._add_lines(self._wrapper.end_paragraph(), pages)
+        if self._page:
+            pages.append((self._page_start, tuple(self._page)))
+            self._page, self._page_bytes = [], self.lines_per_page - 1
+        return pages
+
+    def _add_token(self, token: str, pages: List[LocatedPage]):
+        if token == "\n":
+            self._add_lines(self._wrapper.end_paragraph(), pages)
+        elif not token.isspace():
+            self._add_lines(self._wrapper.add_word(token, self._continued, self._position), pages)
+        self._continued = False
+        self._position += len(token) if token.isascii() else len(token.encode("utf-8"))
+
+    def _add_lines(self, lines: List[Tuple[int, str]], pages: List[LocatedPage]):
+        for start, line in lines:
+            line_bytes = len(line.encode("utf-8"))
+            if self._page and (
+                len(self._page) == self.lines_per_page
+                or (
+                    self.max_page_bytes is not None
+                    and self._page_bytes + line_bytes > self.max_page_bytes
+                )
+            ):
+                pages.append((self._page_start, tuple(self._page)))
+                self._page, self._page_bytes = [], self.lines_per_page - 1
+            if not self._page:
+                self._page_start = start
+            self._page.append(line)
+            self._page_bytes += line_bytes
+
+
+def iter_located_pages(chunks: Iterable[str], **layout) -> Iterator[LocatedPage]:
+    """Pages of text from ``chunks`` with the UTF-8 offset each one starts at."""
+    paginator = Paginator(**layout)
+    for chunk in chunks:
+        yield from paginator.feed_located(chunk)
+    yield from paginator.close_located()
+
+
+def iter_pages(chunks: Iterable[str], **layout) -> Iterator[Tuple[str, ...]]:
+    """Pages of text read lazily from ``chunks``, e.g. ``read_chunks(path)``.
+
+    ``layout`` takes the ``Paginator`` parameters.
+    """
+    paginator = Paginator(**layout)
+    for chunk in chunks:
+        yield from paginator.feed(chunk)
+    yield from paginator.close()
+
+
+async def aiter_pages(chunks: AsyncIterable[str], **layout) -> AsyncIterator[Tuple[str, ...]]:
+    """Pages of text read lazily from an async stream of chunks."""
+    paginator = Paginator(**layout)
+    async for chunk in chunks:
+        for page in paginator.feed(chunk):
+            yield page
+    for page in paginator.close():
+        yield page
+
+
+def count_pages(chunks: Iterable[str], **layout) -> int:
+    """Number of pages of the text in ``chunks``, without keeping any of them."""
+    return sum(1 for _ in iter_pages(chunks, **layout))
+
+
+def read_chunks(source: Union[str, Path, TextIO], chunk_size: int = 64 * 1024) -> Iterator[str]:
+    """Text of a file, or a path to one, in chunks of ``chunk_size`` characters."""
+    if isinstance(source, (str, Path)):
+        with open(source, "r", encoding="utf-8") as f:
+            yield from read_chunks(f, chunk_size)
+        return
+    while True:
+        chunk = source.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+@lru_cache(maxsize=128)
+def layout_lines(text: str, line_width: int = LINE_WIDTH) -> Tuple[str, ...]:
+    """Lines of ``text`` as the display shows them, memoized per text and width."""
+    lines = []
+    for paragraph in text.split("\n"):
+        lines.extend(wrap_paragraph(paragraph, line_width))
+    return tuple(lines)
+
+
+@lru_cache(maxsize=128)
+def layout_pages(
+    text: str,
+    line_width: int = LINE_WIDTH,
+    lines_per_page: int = LINES_PER_PAGE,
+    max_page_bytes: Optional[int] = SEND_RESULT_PAYLOAD_SIZE,
+) -> Tuple[Tuple[str, ...], ...]:
+    """Pages of at most ``lines_per_page`` lines whose UTF-8 text, joined by
+    newlines, stays within ``max_page_bytes``."""
+    return tuple(
+        iter_pages(
+            [text],
+            line_width=line_width,
+            lines_per_page=lines_per_page,
+            max_page_bytes=max_page_bytes,
+        )
+    )
@@ -0,0 +1,242 @@
+import time
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence
+
+
+class ThroughputCounter:
+    """Bytes and packets written to a device and the rate they were sent at."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.bytes_sent = 0
+        self.packets_sent = 0
+        self.started_at: Optional[float] = None
+        self.last_sent_at: Optional[float] = None
+
+    def record(self, nbytes: int, started_at: float):
+        """Account a packet of ``nbytes`` whose write began at ``started_at``."""
+        if self.started_at is None or started_at < self.started_at:
+            self.started_at = started_at
+        self.last_sent_at = time.perf_counter()
+        self.bytes_sent += nbytes
+        self.packets_sent += 1
+
+    @property
+    def bytes_per_second(self) -> float:
+        if self.started_at is None or self.last_sent_at is None:
+            return 0.0
+        elapsed = self.last_sent_at - self.started_at
+        return self.bytes_sent / elapsed if elapsed > 0 else 0.0
+
+    def snapshot(self) -> Dict[str, float]:
+        return {
+            "bytes_sent": self.bytes_sent,
+            "packets_sent": self.packets_sent,
+            "bytes_per_second": self.bytes_per_second,
+        }
+
+
+class RecoveryStats:
+    """Outcome of reconnects and how long links took to come back."""
+
+    def __init__(self):
+        self.recoveries = 0
+        self.failures = 0
+        self.last_time_to_recover: Optional[float] = None
+        self.max_time_to_recover = 0.0
+        self.total_time_to_recover = 0.0
+
+    def record(self, time_to_recover: float):
+        self.recoveries += 1
+        self.last_time_to_recover = time_to_recover
+        self.total_time_to_recover += time_to_recover
+        self.max_time_to_recover = max(self.max_time_to_recover, time_to_recover)
+
+    def record_failure(self):
+        self.failures += 1
+
+    def snapshot(self) -> Dict[str, Optional[float]]:
+        return {
+            "recoveries": self.recoveries,
+            "failures": self.failures,
+            "last_time_to_recover": self.last_time_to_recover,
+            "mean_time_to_recover": (
+                self.total_time_to_recover / self.recoveries if self.recoveries else None
+            ),
+            "max_time_to_recover": self.max_time_to_recover,
+        }
+
+
+class LinkQuality:
+    """Smoothed round-trip time and loss rate of a link, estimated from heartbeat echoes.
+
+    RTT smoothing follows RFC 6298; the loss rate is an exponentially
+    weighted average over heartbeats.
+    """
+
+    RTT_GAIN = 0.125
+    RTTVAR_GAIN = 0.25
+    LOSS_GAIN = 0.1
+
+    def __init__(self):
+        self.srtt: Optional[float] = None
+        self.rttvar: Optional[float] = None
+        self.last_rtt: Optional[float] = None
+        self.loss_rate = 0.0
+        self.sent = 0
+        self.lost = 0
+
+    def record_rtt(self, rtt: float):
+        self.sent += 1
+        self.last_rtt = rtt
+        if self.srtt is None:
+            self.srtt = rtt
+            self.rttvar = rtt / 2
+        else:
+            self.rttvar += self.RTTVAR_GAIN * (abs(self.srtt - rtt) - self.rttvar)
+            self.srtt += self.RTT_GAIN * (rtt - self.srtt)
+        self.loss_rate -= self.LOSS_GAIN * self.loss_rate
+
+    def record_loss(self):
+        self.sent += 1
+        self.lost += 1
+        self.loss_rate += self.LOSS_GAIN * (1.0 - self.loss_rate)
+
+    def reply_timeout(self, maximum: float, minimum: float = 0.2) -> float:
+        """How long to wait for a reply before counting it lost."""
+        if self.srtt is None:
+            return maximum
+        return max(minimum, min(maximum, self.srtt + 4 * self.rttvar))
+
+    def snapshot(self) -> Dict[str, Optional[float]]:
+        return {
+            "srtt": self.srtt,
+            "rttvar": self.rttvar,
+            "last_rtt": self.last_rtt,
+            "loss_rate": self.loss_rate,
+            "sent": self.sent,
+            "lost": self.lost,
+        }
+
+
+# Bucket upper bounds doubling from 10 us to about 21 s
+DURATION_BOUNDS = tuple(1e-5 * 2**i for i in range(22))
+# Bucket upper bounds doubling from 64 B/s to 4 MiB/s
+RATE_BOUNDS = tuple(float(2**i) for i in range(6, 23))
+
+
+class Histogram:
+    """Fixed buckets of doubling width, cheap enough to record every packet.
+
+    Percentiles are reported as the upper bound of the bucket they fall in,
+    capped at the largest value seen, so they overestimate by at most a
+    factor of two.
+    """
+
+    def __init__(self, bounds: Sequence[float] = DURATION_BOUNDS):
+        self.bounds = bounds
+        self.reset()
+
+    def reset(self):
+        # The last bucket holds values above the largest bound
+        self.counts: List[int] = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, value: float):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                return min(self.bounds[index], self.max) if index < len(self.bounds) else self.max
+        return self.max
+
+    def snapshot(self) -> Dict[str, Optional[float]]:
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else None,
+            "p50": self.percentile(0.5),
+            "p90": self.percentile(0.9),
+            "p99": self.percentile(0.99),
+            "max": self.max if self.count else None,
+        }
+
+
+class SendMetrics:
+    """Where the time of a device's sends goes, overall and per command byte.
+
+    ``lock_wait`` is the wait for the write lock, ``write`` the GATT write,
+    ``ack_rtt`` the wait from the write completing to the glasses' reply and
+    ``bytes_per_second`` the rate of each individual write.
+    """
+
+    BOUNDS = {
+        "lock_wait": DURATION_BOUNDS,
+        "write": DURATION_BOUNDS,
+        "ack_rtt": DURATION_BOUNDS,
+        "bytes_per_second": RATE_BOUNDS,
+    }
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.total = self._histograms()
+        self.by_command: Dict[int, Dict[str, Histogram]] = {}
+        self.failures = 0
+
+    def _histograms(self) -> Dict[str, Histogram]:
+        return {metric: Histogram(bounds) for metric, bounds in self.BOUNDS.items()}
+
+    def record(self, command: Optional[int], metric: str, value: float):
+        self.total[metric].record(value)
+        histograms = self.by_command.get(command)
+        if histograms is None:
+            histograms = self.by_command[command] = self._histograms()
+        histograms[metric].record(value)
+
+    def record_write(self, command: Optional[int], nbytes: int, duration: float):
+        self.record(command, "write", duration)
+        if duration > 0:
+            self.record(command, "bytes_per_second", nbytes / duration)
+
+    def snapshot(self) -> Dict:
+        return {
+            "failures": self.failures,
+            "all": {metric: h.snapshot() for metric, h in self.total.items()},
+            "commands": {
+                f"0x{command:02X}" if command is not None else "empty": {
+                    metric: h.snapshot() for metric, h in histograms.items() if h.count
+                }
+                for command, histograms in self.by_command.items()
+            },
+        }
+
+
+class SendHook:
+    """Observer of a device's sends; override the callbacks of interest.
+
+    Callbacks run inline on the send path and must not block.
+    """
+
+    def on_send_start(self, device, data: bytes):
+        pass
+
+    def on_send_finish(self, device, data: bytes, lock_wait: float, write_duration: float):
+        pass
+
+    def on_send_fail(self, device, data: bytes, error: Exception):
+        pass
@@ -1,7 +1,8 @@
 from pydantic import BaseModel, Field, field_validator
-from typing import Literal, List
+from typing import Literal, List, Optional
 import time
 import json
+import random
 from enum import IntEnum
 from datetime import datetime
 
@@ -26,7 +27,10 @@ class Command(IntEnum):
     HEADUP_ANGLE = 0x0B
     DASHBOARD_SHOW = 0x06
     GLASSES_WEAR = 0x27
-    
+    BMP_DATA = 0x15
+    PACKET_END = 0x20
+    CRC_CHECK = 0x16
+
 class GlassesWearStatus(IntEnum):
     ON = 0x01
     OFF = 0x00
@@ -79,6 +83,85 @@ class DashboardState(IntEnum):
     OFF = 0x00
     ON = 0x01
 
+class DispatchPolicy(IntEnum):
+    PARALLEL = 0x00  # Both arms at once
+    LEFT_THEN_RIGHT = 0x01  # Right arm after the left one acknowledged
+    LEFT_ONLY = 0x02
+    RIGHT_ONLY = 0x03
+
+class OverflowPolicy(IntEnum):
+    DROP_OLDEST = 0x00  # Make room by discarding the oldest droppable packet
+    DROP_NEWEST = 0x01  # Discard the packet that does not fit
+    BLOCK = 0x02  # Never drop: wait for room, back-pressuring the notify callback
+
+class SendPriority(IntEnum):
+    HEARTBEAT = 0x00  # Keepalives the firmware times out without
+    CONTROL = 0x01  # Settings and other short commands
+    INTERACTIVE = 0x02  # Text pages and notifications
+    BULK = 0x03  # Image uploads and other multi-packet transfers
+
+class DispatchResult(BaseModel):
+    policy: DispatchPolicy
+    left_ok: Optional[bool] = Field(default=None, description="None if unacknowledged or not sent")
+    right_ok: Optional[bool] = Field(default=None, description="None if unacknowledged or not sent")
+    left_latency: Optional[float] = Field(default=None, description="Seconds until the left arm finished")
+    right_latency: Optional[float] = Field(default=None, description="Seconds until the right arm finished")
+
+    @property
+    def skew(self) -> Optional[float]:
+        """Seconds between the two arms finishing, None unless both were addressed."""
+        if self.left_latency is None or self.right_latency is None:
+            return None
+        return abs(self.left_latency - self.right_latency)
+
+    @property
+    def succeeded(self) -> bool:
+        return self.left_ok is not False and self.right_ok is not False
+
+class ScanResult(BaseModel):
+    connected: bool = Field(default=False, description="Every arm found was connected")
+    left_address: Optional[str] = Field(default=None)
+    right_address: Optional[str] = Field(default=None)
+    time_to_first_connect: Optional[float] = Field(
+        default=None, description="Seconds from scan start until the first arm connected"
+    )
+    elapsed: float = Field(default=0.0, description="Seconds spent scanning and connecting")
+
+    def __bool__(self) -> bool:
+        return self.connected
+
+class BroadcastTargetResult(BaseModel):
+    target: str = Field(..., description="Key of the manager the payload was sent to")
+    ok: bool = Field(default=False)
+    latency: Optional[float] = Field(default=None, description="Seconds until the target finished")
+    error: Optional[str] = Field(default=None)
+
+class BroadcastResult(BaseModel):
+    results: List[BroadcastTargetResult] = Field(default_factory=list)
+    elapsed: float = Field(default=0.0, description="Seconds until every target finished")
+
+    @property
+    def succeeded(self) -> bool:
+        return all(result.ok for result in self.results)
+
+    @property
+    def failed(self) -> List[str]:
+        return [result.target for result in self.results if not result.ok]
+
+class StreamReport(BaseModel):
+    tokens: int = Field(default=0, description="Text deltas received")
+    updates: int = Field(default=0, description="SendResult packets sent to the glasses")
+    pages: int = Field(default=0)
+    bytes_on_air: int = Field(default=0, description="Packet bytes written, summed over arms")
+    time_to_first_glyph: Optional[float] = Field(
+        default=None, description="Seconds from the first token until the glasses took it"
+    )
+    elapsed: float = Field(default=0.0)
+
+    @property
+    def bytes_per_token(self) -> float:
+        return self.bytes_on_air / self.tokens if self.tokens else 0.0
+
 class SendResult(BaseModel):
     command: int = Field(default=Command.SEND_RESULT)
     seq: int = Field(default=0)
@@ -148,9 +231,9 @@ class Notification(BaseModel):
     def to_bytes(self):
         return json.dumps(self.to_json()).encode("utf-8")
 
-    async def construct_notification(self):
+    async def construct_notification(self, max_chunk_size: int = 180 - 4):
+        """Split the JSON payload into chunks of at most ``max_chunk_size`` bytes plus a 4-byte header."""
         json_bytes = self.to_bytes()
-        max_chunk_size = 180 - 4  # Subtract 4 bytes for header
         chunks = [
             json_bytes[i : i + max_chunk_size]
             for i in range(0, len(json_bytes), max_chunk_size)
@@ -169,6 +252,19 @@ class RSVPConfig(BaseModel):
     wpm: int = Field(default=250)
     padding_char: str = Field(default="...")
 
+class ReconnectPolicy(BaseModel):
+    initial_delay: float = Field(default=0.25, description="Seconds before the second attempt")
+    max_delay: float = Field(default=30.0, description="Upper bound of the backoff")
+    multiplier: float = Field(default=2.0)
+    jitter: float = Field(default=0.5, description="Fraction of each delay that is randomized")
+    max_attempts: int = Field(default=10)
+
+    def delay(self, attempt: int) -> float:
+        """Seconds to wait after failed attempt number ``attempt`` (starting at 1)."""
+        backoff = min(self.max_delay, self.initial_delay * self.multiplier ** (attempt - 1))
+        # Randomize so both arms, or many pairs, do not retry in lockstep
+        return backoff * (1 - self.jitter * random.random())
+
 class BleReceive(BaseModel):
     lr: str = Field(default="L", description="Left or Right")
     cmd: int = Field(default=0x00)
@@ -0,0 +1,80 @@
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional
+
+
+class PacketCache:
+    """Encoded packets kept by the arguments they were built from, least recently used out first.
+
+    Entries are charged their packet length plus the length of any text in
+    their key, and the cache stays within ``max_bytes``; 0 turns it off.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, bytes]" = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        packet = self._entries.get(key)
+        if packet is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return packet
+
+    def put(self, key: Hashable, packet: bytes):
+        size = len(packet) + sum(len(part) for part in key if isinstance(part, str))
+        if size > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = packet
+        self._sizes[key] = size
+        self.bytes += size
+        self._evict()
+
+    def resize(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._evict()
+
+    def clear(self):
+        self._entries.clear()
+        self._sizes.clear()
+        self.bytes = 0
+
+    def _remove(self, key: Hashable):
+        del self._entries[key]
+        self.bytes -= self._sizes.pop(key)
+
+    def _evict(self):
+        while self.bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def snapshot(self) -> Dict:
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
+
+
+# SendResult pages by (text, page number, page count, screen status, seq)
+text_packet_cache = PacketCache()
@@ -0,0 +1,120 @@
+import logging
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+TX = "tx"
+RX = "rx"
+
+
+class PacketRecord:
+    """One packet on the wire, formatted only when it is actually printed."""
+
+    __slots__ = ("timestamp", "device", "direction", "data")
+
+    def __init__(self, timestamp: float, device: str, direction: str, data: bytes):
+        self.timestamp = timestamp
+        self.device = device
+        self.direction = direction
+        self.data = data
+
+    @property
+    def command(self) -> Optional[int]:
+        return self.data[0] if self.data else None
+
+    def to_dict(self) -> Dict:
+        return {
+            "timestamp": self.timestamp,
+            "device": self.device,
+            "direction": self.direction,
+            "command": self.command,
+            "data": self.data.hex(),
+        }
+
+    def __str__(self) -> str:
+        command = f"0x{self.command:02X}" if self.command is not None else "----"
+        return (
+            f"{self.timestamp:.6f} {self.device} {self.direction} {command} "
+            f"({len(self.data)} bytes): {self.data.hex()}"
+        )
+
+
+class PacketLog:
+    """Packets sent to and received from the glasses, off unless enabled.
+
+    Call sites check ``enabled`` before calling ``record``, so a disabled log
+    costs one attribute lookup per packet. When enabled, packets of a command
+    are emitted at DEBUG on the ``even_glasses.packet_log`` logger at that
+    command's sampling rate, and the last ``ring_size`` packets, sampled or
+    not, are kept in memory for ``dump``.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.emit = False
+        self.default_rate = 1.0
+        self._default_interval = 1
+        self._intervals: Dict[int, int] = {}
+        self._counts: Dict[int, int] = {}
+        self.ring: Optional[Deque[PacketRecord]] = None
+
+    def configure(
+        self,
+        enabled: bool = True,
+        emit: bool = True,
+        default_rate: float = 1.0,
+        sample_rates: Optional[Dict[int, float]] = None,
+        ring_size: int = 0,
+    ):
+        """Set what is logged.
+
+        ``sample_rates`` maps command bytes to the fraction of their packets
+        emitted, e.g. ``{Command.RECEIVE_MIC_DATA: 0.01}``; other commands use
+        ``default_rate``. ``ring_size`` keeps that many recent packets in memory.
+        """
+        self.emit = emit
+        self.default_rate = default_rate
+        self._intervals = {
+            command: _sampling_interval(rate) for command, rate in (sample_rates or {}).items()
+        }
+        self._default_interval = _sampling_interval(default_rate)
+        self._counts = {}
+        self.ring = deque(maxlen=ring_size) if ring_size else None
+        self.enabled = enabled and (emit or self.ring is not None)
+
+    def disable(self):
+        self.enabled = False
+
+    def record(self, device: str, direction: str, data: bytes):
+        record = PacketRecord(time.time(), device, direction, bytes(data))
+        if self.ring is not None:
+            self.ring.append(record)
+        if not self.emit:
+            return
+        command = record.command
+        interval = self._intervals.get(command, self._default_interval)
+        if not interval:
+            return
+        count = self._counts.get(command, 0)
+        self._counts[command] = count + 1
+        if count % interval == 0:
+            # Formatted by the logging module, and only if a handler wants it
+            logger.debug("%s", record)
+
+    def dump(self) -> List[Dict]:
+        """Packets kept in the ring buffer, oldest first."""
+        if self.ring is None:
+            return []
+        return [record.to_dict() for record in self.ring]
+
+
+def _sampling_interval(rate: float) -> int:
+    """Emit every n-th packet for a rate, 0 to emit none."""
+    if rate <= 0:
+        return 0
+    return max(1, round(1 / min(rate, 1.0)))
+
+
+packet_log = PacketLog()
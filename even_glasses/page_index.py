@@ -0,0 +1,149 @@
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+from even_glasses.layout import (
+    Paginator,
+    iter_located_pages,
+    read_chunks,
+    ASCII_ADVANCES,
+    DEFAULT_ADVANCE,
+    WIDE_ADVANCE,
+    LINE_WIDTH,
+    LINES_PER_PAGE,
+)
+from even_glasses.registry import DEFAULT_REGISTRY_PATH
+from even_glasses.utils import SEND_RESULT_PAYLOAD_SIZE
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INDEX_DIR = DEFAULT_REGISTRY_PATH.parent / "page_index"
+
+# Magic and page count, followed by page count + 1 little-endian offsets,
+# the last one being the end of the document
+INDEX_HEADER = struct.Struct("<8sQ")
+INDEX_MAGIC = b"EGPIDX01"
+OFFSET = struct.Struct("<Q")
+
+
+def document_hash(path: Union[str, Path], chunk_size: int = 1024 * 1024) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(chunk_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def layout_key(line_width: int, lines_per_page: int, max_page_bytes: Optional[int]) -> str:
+    """Digest of everything that decides where pages start, glyph widths included."""
+    parameters = {
+        "line_width": line_width,
+        "lines_per_page": lines_per_page,
+        "max_page_bytes": max_page_bytes,
+        "advances": [ASCII_ADVANCES, DEFAULT_ADVANCE, WIDE_ADVANCE],
+    }
+    return hashlib.sha256(json.dumps(parameters, sort_keys=True).encode()).hexdigest()[:16]
+
+
+class PageIndex:
+    """Where every page of a UTF-8 document starts, so any page is shown without reflowing.
+
+    The index is built once per document content and layout, stored under
+    ``index_dir`` and memory-mapped on later opens, also by later processes.
+    ``page`` then lays out only the bytes of the page asked for.
+    """
+
+    def __init__(
+        self,
+        document_path: Union[str, Path],
+        index_dir: Union[str, Path] = DEFAULT_INDEX_DIR,
+        line_width: int = LINE_WIDTH,
+        lines_per_page: int = LINES_PER_PAGE,
+        max_page_bytes: Optional[int] = SEND_RESULT_PAYLOAD_SIZE,
+    ):
+        self.document_path = Path(document_path)
+        self.layout = {
+            "line_width": line_width,
+            "lines_per_page": lines_per_page,
+            "max_page_bytes": max_page_bytes,
+        }
+        key = f"{document_hash(self.document_path)}-{layout_key(**self.layout)}"
+        self.index_path = Path(index_dir) / f"{key}.idx"
+        self.built = False
+        if not self._valid_index():
+            self.build()
+            self.built = True
+        self._open()
+
+    def _valid_index(self) -> bool:
+        try:
+            with open(self.index_path, "rb") as f:
+                magic, count = INDEX_HEADER.unpack(f.read(INDEX_HEADER.size))
+            expected = INDEX_HEADER.size + (count + 1) * OFFSET.size
+            return magic == INDEX_MAGIC and self.index_path.stat().st_size == expected
+        except (OSError, struct.error):
+            return False
+
+    def build(self):
+        """Paginate the whole document once and write the page offsets."""
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.index_path.with_suffix(".tmp")
+        count = 0
+        with open(temporary, "wb") as index:
+            index.write(INDEX_HEADER.pack(INDEX_MAGIC, 0))
+            # No newline translation, so offsets are those of the bytes on disk
+            with open(self.document_path, "r", encoding="utf-8", newline="") as document:
+                for start, _ in iter_located_pages(read_chunks(document), **self.layout):
+                    index.write(OFFSET.pack(start))
+                    count += 1
+            index.write(OFFSET.pack(self.document_path.stat().st_size))
+            index.seek(0)
+            index.write(INDEX_HEADER.pack(INDEX_MAGIC, count))
+        os.replace(temporary, self.index_path)
+        logger.info(f"Indexed {count} pages of {self.document_path}")
+
+    def _open(self):
+        with open(self.index_path, "rb") as f:
+            self._index = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        _, self.page_count = INDEX_HEADER.unpack_from(self._index)
+        document_size = self.document_path.stat().st_size
+        with open(self.document_path, "rb") as f:
+            # Empty files cannot be mapped
+            self._document = (
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if document_size else b""
+            )
+
+    def __len__(self) -> int:
+        return self.page_count
+
+    def offsets(self, page_number: int) -> Tuple[int, int]:
+        """UTF-8 byte range of page ``page_number``, counted from 1 like SendResult pages."""
+        if not 1 <= page_number <= self.page_count:
+            raise IndexError(f"Page {page_number} out of range 1..{self.page_count}")
+        position = INDEX_HEADER.size + (page_number - 1) * OFFSET.size
+        start, = OFFSET.unpack_from(self._index, position)
+        end, = OFFSET.unpack_from(self._index, position + OFFSET.size)
+        return start, end
+
+    def page(self, page_number: int) -> Tuple[str, ...]:
+        """Lines of page ``page_number``, laid out from that page's bytes only."""
+        start, end = self.offsets(page_number)
+        paginator = Paginator(**self.layout)
+        pages = paginator.feed(self._document[start:end].decode("utf-8")) + paginator.close()
+        return pages[0] if pages else ()
+
+    def close(self):
+        self._index.close()
+        if isinstance(self._document, mmap.mmap):
+            self._document.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
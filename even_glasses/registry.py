@@ -0,0 +1,84 @@
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from pydantic import BaseModel, Field
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REGISTRY_PATH = Path.home() / ".even_glasses" / "devices.json"
+
+
+class PairRecord(BaseModel):
+    left_address: str = Field(..., description="Address of the left arm")
+    left_name: str = Field(..., description="Advertised name of the left arm")
+    right_address: str = Field(..., description="Address of the right arm")
+    right_name: str = Field(..., description="Advertised name of the right arm")
+    last_seen: float = Field(
+        default_factory=time.time, description="Seconds since the epoch of the last connection"
+    )
+
+
+class DeviceRegistry:
+    """Pairs connected before, kept on disk so later starts can connect without scanning."""
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_REGISTRY_PATH):
+        self.path = Path(path)
+        self._pairs: Dict[str, PairRecord] = self._load()
+
+    def _load(self) -> Dict[str, PairRecord]:
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, "r") as f:
+                records = json.load(f)
+            if not isinstance(records, dict):
+                logger.warning(f"Ignoring device registry {self.path}, not a JSON object")
+                return {}
+            return {
+                record["left_address"]: PairRecord(**record)
+                for record in records.get("pairs", [])
+            }
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable device registry {self.path}: {e}")
+            return {}
+
+    def _save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        records = {"pairs": [record.model_dump() for record in self._pairs.values()]}
+        # Write to a temporary file first so a crash never leaves a truncated registry
+        temporary = self.path.with_suffix(".tmp")
+        with open(temporary, "w") as f:
+            json.dump(records, f, indent=2)
+        os.replace(temporary, self.path)
+
+    def pairs(self) -> List[PairRecord]:
+        """Known pairs, most recently seen first."""
+        return sorted(self._pairs.values(), key=lambda record: record.last_seen, reverse=True)
+
+    def latest(self) -> Optional[PairRecord]:
+        pairs = self.pairs()
+        return pairs[0] if pairs else None
+
+    def record(self, left_address: str, left_name: str, right_address: str, right_name: str):
+        """Remember a pair that just connected."""
+        self._pairs[left_address] = PairRecord(
+            left_address=left_address,
+            left_name=left_name,
+            right_address=right_address,
+            right_name=right_name,
+        )
+        try:
+            self._save()
+        except OSError as e:
+            logger.warning(f"Could not save device registry {self.path}: {e}")
+
+    def forget(self, left_address: str):
+        if self._pairs.pop(left_address, None) is not None:
+            try:
+                self._save()
+            except OSError as e:
+                logger.warning(f"Could not save device registry {self.path}: {e}")
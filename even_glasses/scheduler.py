@@ -0,0 +1,120 @@
+import asyncio
+import heapq
+import itertools
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional, Tuple
+
+from even_glasses.models import Command, SendPriority
+
+INTERACTIVE_COMMANDS = frozenset({Command.SEND_RESULT, Command.NOTIFICATION})
+
+
+def priority_for(packet: bytes, bulk: bool = False) -> SendPriority:
+    """Scheduling class of an outgoing packet."""
+    command = packet[0] if packet else None
+    if command == Command.HEARTBEAT:
+        return SendPriority.HEARTBEAT
+    if bulk or command == Command.BMP_DATA:
+        return SendPriority.BULK
+    if command in INTERACTIVE_COMMANDS:
+        return SendPriority.INTERACTIVE
+    return SendPriority.CONTROL
+
+
+class PriorityStats:
+    """Queue depth and lock wait times of one scheduling class."""
+
+    def __init__(self):
+        self.depth = 0
+        self.max_depth = 0
+        self.acquired = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record_wait(self, wait: float):
+        self.acquired += 1
+        self.total_wait += wait
+        if wait > self.max_wait:
+            self.max_wait = wait
+
+    def snapshot(self) -> Dict[str, float]:
+        return {
+            "depth": self.depth,
+            "max_depth": self.max_depth,
+            "acquired": self.acquired,
+            "mean_wait": self.total_wait / self.acquired if self.acquired else 0.0,
+            "max_wait": self.max_wait,
+        }
+
+
+class PriorityWriteLock:
+    """Write lock handing the link to the most urgent waiter rather than the oldest.
+
+    Waiters of the same class are served in arrival order. Multi-packet
+    transfers hold the lock across packets but check ``urgent_waiting`` at
+    each boundary, so a more urgent packet gets the link at the next one.
+    """
+
+    def __init__(self):
+        self._locked = False
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._counter = itertools.count()
+        self.stats: Dict[SendPriority, PriorityStats] = {
+            priority: PriorityStats() for priority in SendPriority
+        }
+
+    def locked(self) -> bool:
+        return self._locked
+
+    async def acquire(self, priority: SendPriority = SendPriority.CONTROL):
+        stats = self.stats[priority]
+        if not self._locked and not self._waiters:
+            self._locked = True
+            stats.record_wait(0.0)
+            return
+
+        started_at = time.perf_counter()
+        waiter = asyncio.get_running_loop().create_future()
+        entry = (priority, next(self._counter), waiter)
+        heapq.heappush(self._waiters, entry)
+        stats.depth += 1
+        stats.max_depth = max(stats.max_depth, stats.depth)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Ownership was handed over just before cancellation
+                self.release()
+            elif entry in self._waiters:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+            raise
+        finally:
+            stats.depth -= 1
+        stats.record_wait(time.perf_counter() - started_at)
+
+    def urgent_waiting(self, priority: SendPriority) -> bool:
+        """Whether a more urgent class than ``priority`` is waiting for the lock."""
+        return bool(self._waiters) and self._waiters[0][0] < priority
+
+    def release(self):
+        while self._waiters:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                # Hand the lock over without unlocking in between
+                waiter.set_result(None)
+                return
+        self._locked = False
+
+    @asynccontextmanager
+    async def hold(self, priority: Optional[SendPriority] = None):
+        await self.acquire(SendPriority.CONTROL if priority is None else priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Per-class queue depth and wait statistics, keyed by class name."""
+        return {priority.name: stats.snapshot() for priority, stats in self.stats.items()}
@@ -0,0 +1,255 @@
+import asyncio
+import random
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable, List, Optional, Set
+
+from bleak import BleakClient
+from bleak.exc import BleakError
+
+from even_glasses.models import Command, ResponseStatus
+from even_glasses.service_identifiers import (
+    UART_SERVICE_UUID,
+    UART_TX_CHAR_UUID,
+    UART_RX_CHAR_UUID,
+)
+
+NotifyCallback = Callable[[Any, bytearray], Awaitable[None]]
+DisconnectedCallback = Callable[["Transport"], None]
+Responder = Callable[[bytes], Optional[bytes]]
+
+
+class TransportError(Exception):
+    """Raised when a transport cannot carry a request."""
+
+
+class Transport(ABC):
+    """Base class for the link carrying UART traffic to a single arm."""
+
+    def __init__(self, address: str):
+        self.address = address
+        self.disconnected_callback: Optional[DisconnectedCallback] = None
+
+    @property
+    @abstractmethod
+    def is_connected(self) -> bool:
+        ...
+
+    @property
+    @abstractmethod
+    def mtu_size(self) -> int:
+        """Negotiated ATT MTU of the link."""
+
+    def set_disconnected_callback(self, callback: Optional[DisconnectedCallback]):
+        self.disconnected_callback = callback
+
+    @abstractmethod
+    async def connect(self) -> None:
+        ...
+
+    @abstractmethod
+    async def disconnect(self) -> None:
+        ...
+
+    @abstractmethod
+    async def write(self, data: bytes, response: bool = True) -> None:
+        """Write a packet to the UART TX characteristic."""
+
+    @abstractmethod
+    async def start_notify(self, callback: NotifyCallback) -> None:
+        """Subscribe ``callback`` to the UART RX characteristic."""
+
+    @abstractmethod
+    async def stop_notify(self) -> None:
+        ...
+
+
+class BleakTransport(Transport):
+    """Transport backed by a BleakClient talking to real hardware."""
+
+    def __init__(self, address: str):
+        super().__init__(address)
+        self.client = BleakClient(
+            address,
+            disconnected_callback=self._handle_disconnection,
+            # Only the UART service is used, skip resolving the others
+            services=[UART_SERVICE_UUID],
+        )
+        self.uart_tx = None
+        self.uart_rx = None
+        # Handles resolved on the first connection, reused on reconnects
+        self._tx_handle: Optional[int] = None
+        self._rx_handle: Optional[int] = None
+
+    @property
+    def is_connected(self) -> bool:
+        return self.client.is_connected
+
+    @property
+    def mtu_size(self) -> int:
+        return self.client.mtu_size
+
+    def _handle_disconnection(self, client: BleakClient):
+        if self.disconnected_callback:
+            self.disconnected_callback(self)
+
+    async def connect(self) -> None:
+        await self.client.connect()
+
+        services = self.client.services
+        if self._tx_handle is not None and self._rx_handle is not None:
+            self.uart_tx = services.get_characteristic(self._tx_handle)
+            self.uart_rx = services.get_characteristic(self._rx_handle)
+            if self.uart_tx and self.uart_rx:
+                return
+
+        uart_service = services.get_service(UART_SERVICE_UUID)
+        if not uart_service:
+            raise BleakError(f"UART service not found for {self.address}")
+
+        self.uart_tx = uart_service.get_characteristic(UART_TX_CHAR_UUID)
+        self.uart_rx = uart_service.get_characteristic(UART_RX_CHAR_UUID)
+
+        if not self.uart_tx or not self.uart_rx:
+            raise BleakError(f"UART TX/RX characteristics not found for {self.address}")
+        self._tx_handle = self.uart_tx.handle
+        self._rx_handle = self.uart_rx.handle
+
+    async def disconnect(self) -> None:
+        if self.client.is_connected:
+            await self.client.disconnect()
+
+    async def write(self, data: bytes, response: bool = True) -> None:
+        if not self.uart_tx:
+            raise BleakError(f"No TX characteristic available for {self.address}")
+        await self.client.write_gatt_char(self.uart_tx, data, response=response)
+
+    async def start_notify(self, callback: NotifyCallback) -> None:
+        if not self.uart_rx:
+            raise BleakError(f"No RX characteristic available for {self.address}")
+        await self.client.start_notify(self.uart_rx, callback)
+
+    async def stop_notify(self) -> None:
+        if self.uart_rx:
+            await self.client.stop_notify(self.uart_rx)
+
+
+def g1_responder(data: bytes) -> Optional[bytes]:
+    """Reply to a packet the way G1 firmware acknowledges UART commands."""
+    if not data:
+        return None
+    command = data[0]
+    if command == Command.HEARTBEAT:
+        # Heartbeats are echoed back verbatim
+        return bytes(data)
+    if command == Command.BMP_DATA:
+        # BMP data packets are not acknowledged individually
+        return None
+    return bytes([command, ResponseStatus.SUCCESS])
+
+
+class LoopbackTransport(Transport):
+    """In-process transport emulating a G1 arm, for running send paths without hardware.
+
+    Every write takes ``latency`` seconds, ``drop_rate`` is the fraction of writes
+    that never reach the device and ``responder`` builds the notification sent back
+    for each delivered packet (``None`` to stay silent).
+    """
+
+    def __init__(
+        self,
+        address: str = "loopback",
+        latency: float = 0.0,
+        mtu: int = 247,
+        drop_rate: float = 0.0,
+        responder: Optional[Responder] = g1_responder,
+        seed: Optional[int] = None,
+    ):
+        super().__init__(address)
+        if not 0.0 <= drop_rate <= 1.0:
+            raise ValueError("Drop rate must be between 0 and 1")
+        self.latency = latency
+        self.mtu = mtu
+        self.drop_rate = drop_rate
+        self.responder = responder
+        self.received: List[bytes] = []
+        self.writes = 0
+        self.dropped = 0
+        self._connected = False
+        self._notify_callback: Optional[NotifyCallback] = None
+        self._random = random.Random(seed)
+        self._deliveries: Set[asyncio.Task] = set()
+
+    @property
+    def is_connected(self) -> bool:
+        return self._connected
+
+    @property
+    def mtu_size(self) -> int:
+        return self.mtu
+
+    async def connect(self) -> None:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        self._connected = True
+
+    async def disconnect(self) -> None:
+        if not self._connected:
+            return
+        self._connected = False
+        self._notify_callback = None
+        if self.disconnected_callback:
+            self.disconnected_callback(self)
+
+    def simulate_disconnect(self):
+        """Drop the link as if the arm went out of range."""
+        self._connected = False
+        if self.disconnected_callback:
+            self.disconnected_callback(self)
+
+    async def write(self, data: bytes, response: bool = True) -> None:
+        if not self._connected:
+            raise TransportError(f"{self.address} is not connected")
+        self.writes += 1
+        data = bytes(data)
+        if not response and len(data) > self.mtu - 3:
+            # Long writes only exist for write-with-response
+            raise TransportError(
+                f"Packet of {len(data)} bytes exceeds MTU {self.mtu} of {self.address}"
+            )
+
+        # Packets reach the device in the order they were issued, even when
+        # several writes are in flight at once.
+        dropped = bool(self.drop_rate) and self._random.random() < self.drop_rate
+        if not dropped:
+            self.received.append(data)
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        if dropped:
+            self.dropped += 1
+            if response:
+                raise TransportError(f"Write to {self.address} was not acknowledged")
+            return
+
+        if self.responder and self._notify_callback:
+            reply = self.responder(data)
+            if reply is not None:
+                self._deliver(reply)
+
+    def inject(self, data: bytes):
+        """Deliver an unsolicited notification, e.g. a touch event."""
+        if self._notify_callback:
+            self._deliver(data)
+
+    def _deliver(self, data: bytes):
+        task = asyncio.get_running_loop().create_task(
+            self._notify_callback(self, bytearray(data))
+        )
+        self._deliveries.add(task)
+        task.add_done_callback(self._deliveries.discard)
+
+    async def start_notify(self, callback: NotifyCallback) -> None:
+        self._notify_callback = callback
+
+    async def stop_notify(self) -> None:
+        self._notify_callback = None
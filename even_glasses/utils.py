@@ -1,10 +1,8 @@
-import struct
-import asyncio
-from typing import List
+from typing import List, Optional
 from even_glasses.models import (
     Command,
+    ResponseStatus,
     NCSNotification,
-    Notification,
     NoteAdd,
     SubCommand,
     MicStatus,
@@ -14,207 +12,187 @@ from even_glasses.models import (
     DashboardState,
     GlassesWearStatus,
 )
-import numpy as np
-import numba
+from even_glasses.codec import (
+    encode_heartbeat,
+    encode_notification_json,
+    encode_notification_chunks,
+    encode_note_add,
+    encode_note_delete,
+    encode_headup_angle,
+    encode_glasses_wear,
+    encode_clear_screen,
+    encode_start_ai,
+    encode_mic_command,
+    encode_send_result,
+    encode_silent_mode,
+    encode_brightness,
+    encode_dashboard_show_state,
+    encode_packet_end,
+    encode_crc_check,
+    encode_bmp_packet,
+)
 
 
 def construct_heartbeat(seq: int) -> bytes:
-    length = 6
-    return struct.pack(
-        "BBBBBB",
-        Command.HEARTBEAT,
-        length & 0xFF,
-        (length >> 8) & 0xFF,
-        seq % 0xFF,
-        0x04,
-        seq % 0xFF,
-    )
+    return encode_heartbeat(seq)
+
+
+# Every BLE link starts with this ATT MTU; backends also report it when the
+# negotiated value is unknown, so it is never trusted for sizing.
+DEFAULT_ATT_MTU = 23
+# Opcode and handle of an ATT write
+ATT_WRITE_OVERHEAD = 3
+
+# Protocol maxima of the payload carried by one packet, and their headers
+IMAGE_PACKET_SIZE = 194
+IMAGE_PACKET_HEADER = 6  # Command, seq and the storage address of the first packet
+NOTIFICATION_CHUNK_SIZE = 176
+NOTIFICATION_CHUNK_HEADER = 4
+SEND_RESULT_PAYLOAD_SIZE = 235  # Page text that fits one write at an MTU of 247
+SEND_RESULT_HEADER = 9
+# Smallest payload worth fitting into one write; below it packets keep the
+# protocol size and go out as long writes with response
+MIN_PACKET_BUDGET = 64
+
+
+def packet_budget(mtu: Optional[int], header: int, maximum: int) -> int:
+    """Payload bytes per packet so that one packet fits a single ATT write.
+
+    The protocol ``maximum`` stays an upper bound. When the MTU is unknown
+    or was not raised above the default, packets keep the protocol size and
+    the stack fragments them as before. The same goes for an MTU so small
+    that fewer than ``MIN_PACKET_BUDGET`` bytes would fit, which would
+    multiply the packets and overflow their one-byte counters.
+    """
+    if not mtu or mtu <= DEFAULT_ATT_MTU:
+        return maximum
+    budget = min(maximum, mtu - ATT_WRITE_OVERHEAD - header)
+    if budget < min(maximum, MIN_PACKET_BUDGET):
+        return maximum
+    return budget
+
+
+def reply_sequence(packet: bytes) -> Optional[int]:
+    """Sequence number a reply to ``packet`` carries, None if it echoes none."""
+    if packet[0] == Command.HEARTBEAT and len(packet) > 3:
+        return packet[3]
+    return None
+
 
+def is_failure_reply(reply: Optional[bytes]) -> bool:
+    """Whether the glasses answered a command with ResponseStatus.FAILURE."""
+    return reply is not None and len(reply) > 1 and reply[1] == ResponseStatus.FAILURE
 
-async def construct_notification(ncs_notification=NCSNotification):
-    # Create Notification instance
-    notification = Notification(ncs_notification=ncs_notification, type="Add")
 
-    # Get notification chunks
-    chunks = await notification.construct_notification()
-    return chunks
+async def construct_notification(
+    ncs_notification=NCSNotification, max_chunk_size: int = NOTIFICATION_CHUNK_SIZE
+):
+    return encode_notification_chunks(encode_notification_json(ncs_notification), max_chunk_size)
 
 
 def construct_headup_angle(angle: int) -> bytes:
     """Construct command to set head-up display angle."""
     if not 0 <= angle <= 60:
         raise ValueError("Angle must be between 0 and 60 degrees")
-    angle_byte = angle & 0xFF
-    return bytes([Command.HEADUP_ANGLE, angle_byte, 0x01])
+    return encode_headup_angle(angle)
 
 
 def construct_note_delete(note_number: int) -> bytes:
     """Construct command to delete a note with the given number."""
     if not 1 <= note_number <= 4:
         raise ValueError("Note number must be between 1 and 4")
-    return bytes(
-        [
-            0x1E,
-            0x10,
-            0x00,
-            0xE0,
-            0x03,
-            0x01,
-            0x00,
-            0x01,
-            0x00,
-            note_number,
-            0x00,
-            0x01,
-            0x00,
-            0x01,
-            0x00,
-            0x00,
-        ]
-    )
+    return encode_note_delete(note_number)
 
 
 def construct_note_add(note_number: int, name: str, text: str) -> bytes:
     """Construct command to add or change a note with a name and text."""
     note_add = NoteAdd(note_number=note_number, name=name, text=text)
-    return note_add.build()
+    return encode_note_add(
+        note_add.note_number, note_add.name, note_add.text, note_add._get_versioning_byte()
+    )
 
 def construct_glasses_wear_command(status: GlassesWearStatus) -> bytes:
     """Construct command to set glasses wear detection."""
-    return bytes([Command.GLASSES_WEAR, status])
+    return encode_glasses_wear(status)
 
 
 def construct_clear_screen() -> bytes:
     """Construct command to clear the screen."""
-    return bytes(
-        [
-            Command.START_AI,
-            SubCommand.STOP,
-            0x00,
-            0x00,
-            0x00,
-        ]
-    )
+    return encode_clear_screen()
 
 
 def construct_start_ai(subcmd: SubCommand, param: bytes = b"") -> bytes:
-    return bytes([Command.START_AI, subcmd]) + param
+    return encode_start_ai(subcmd, param)
 
 
 def construct_mic_command(enable: MicStatus) -> bytes:
-    return bytes([Command.OPEN_MIC, enable])
+    return encode_mic_command(enable)
 
 
 def construct_result(result: SendResult) -> bytes:
-    return result.build()
+    return encode_send_result(
+        result.data,
+        result.seq,
+        result.total_packages,
+        result.current_package,
+        result.screen_status,
+        (result.new_char_pos0 << 8) | result.new_char_pos1,
+        result.page_number,
+        result.max_pages,
+    )
 
 
 def construct_silent_mode(status: SilentModeStatus) -> bytes:
     """Construct command to set silent mode."""
-    return bytes([Command.SILENT_MODE, status, 0x00])
+    return encode_silent_mode(status)
 
 
 def construct_brightness(level: int, auto: BrightnessAuto) -> bytes:
     """Construct command to set brightness with auto setting."""
     if not 0x00 <= level <= 0x29:
         raise ValueError("Brightness level must be between 0x00 and 0x29")
-    return bytes([Command.BRIGHTNESS, level, auto])
+    return encode_brightness(level, auto)
 
 
 def construct_dashboard_show_state(state: DashboardState, position: int) -> bytes:
     """Construct command to show or hide the dashboard with position."""
-    state_value = 0x01 if state == DashboardState.ON else 0x00
-    return bytes(
-        [Command.DASHBOARD_POSITION, 0x07, 0x00, 0x01, 0x02, state_value, position]
-    )
+    return encode_dashboard_show_state(state == DashboardState.ON, position)
+
+def divide_image_data(image_data: bytes, packet_size: int = IMAGE_PACKET_SIZE) -> List[memoryview]:
+    """Divide image data into packets of ``packet_size`` bytes, as views of ``image_data``."""
+    view = memoryview(image_data).cast("B")
+    return [view[start : start + packet_size] for start in range(0, len(view), packet_size)]
 
-@numba.njit
-def crc32_numba(data):
-    """Compute CRC32 using Numba JIT compilation."""
-    crc = 0xFFFFFFFF
-    for byte in data:
-        crc ^= byte
-        for _ in range(8):
-            if crc & 1:
-                crc = (crc >> 1) ^ 0xEDB88320
-            else:
-                crc >>= 1
-    return crc ^ 0xFFFFFFFF
-
-@numba.njit
-def divide_image_data_numba(data_array, packet_size):
-    """Divide image data into packets using Numba."""
-    total_length = data_array.shape[0]
-    num_packets = (total_length + packet_size - 1) // packet_size
-    packets = []
-    for i in range(num_packets):
-        start = i * packet_size
-        end = min(start + packet_size, total_length)
-        packet = data_array[start:end]
-        packets.append(packet)
-    return packets
-
-def divide_image_data(image_data: bytes) -> List[np.ndarray]:
-    """Divide image data into packets of 194 bytes using NumPy."""
-    packet_size = 194
-    data_array = np.frombuffer(image_data, dtype=np.uint8)
-    # Use Numba-optimized function
-    packets = divide_image_data_numba(data_array, packet_size)
-    return packets
-
-@numba.njit
-def construct_bmp_data_packet_numba(seq, data_packet, is_first_packet):
-    """Construct BMP data packet with command 0x15 using Numba."""
-    command = 0x15
-    seq_byte = seq & 0xFF
-    if is_first_packet:
-        address = np.array([0x00, 0x1C, 0x00, 0x00], dtype=np.uint8)
-        packet_header = np.array([command, seq_byte], dtype=np.uint8)
-        full_packet = np.concatenate((packet_header, address, data_packet))
-    else:
-        packet_header = np.array([command, seq_byte], dtype=np.uint8)
-        full_packet = np.concatenate((packet_header, data_packet))
-    return full_packet
-
-def construct_bmp_data_packet(seq: int, data_packet: np.ndarray, is_first_packet: bool) -> np.ndarray:
+
+def construct_bmp_data_packet(seq: int, data_packet, is_first_packet: bool) -> bytes:
     """Construct BMP data packet with command 0x15."""
-    return construct_bmp_data_packet_numba(seq, data_packet, is_first_packet)
+    return encode_bmp_packet(seq, data_packet, is_first_packet)
+
 
 def construct_packet_end_command() -> bytes:
     """Construct packet end command [0x20, 0x0d, 0x0e]."""
-    return bytes([0x20, 0x0D, 0x0E])
-
-@numba.njit
-def construct_crc_check_command_numba(image_data_array):
-    """Construct CRC check command with command 0x16 using Numba."""
-    command = 0x16
-    address = np.array([0x00, 0x1C, 0x00, 0x00], dtype=np.uint8)
-    crc_data = np.concatenate((address, image_data_array))
-    crc = crc32_numba(crc_data) & 0xFFFFFFFF
-    crc_bytes = np.array([
-        (crc >> 24) & 0xFF,
-        (crc >> 16) & 0xFF,
-        (crc >> 8) & 0xFF,
-        crc & 0xFF
-    ], dtype=np.uint8)
-    full_command = np.concatenate((np.array([command], dtype=np.uint8), crc_bytes))
-    return full_command
-
-def construct_crc_check_command(image_data_array: np.ndarray) -> bytes:
+    return encode_packet_end()
+
+
+def construct_crc_check_command(image_data) -> bytes:
     """Construct CRC check command with command 0x16."""
-    command_array = construct_crc_check_command_numba(image_data_array)
-    return command_array.tobytes()
+    return encode_crc_check(image_data)
+
 
-async def send_data_to_glass(glass, data_packets: List[np.ndarray], full_image_array: np.ndarray):
+async def send_data_to_glass(
+    glass,
+    data_packets: List[bytes],
+    full_image_array: bytes,
+    ack_timeout: float = 1.0,
+) -> bool:
     """Send data packets to a single glass."""
-    # Send all data packets sequentially
-    for data_packet in data_packets:
-        await glass.send(data_packet.tobytes())
-    # Send packet end command
+    # Send all data packets back to back, pipelined when the glass allows it
+    if await glass.send_many(data_packets, bulk=True) < len(data_packets):
+        return False
+    # Send packet end command and wait for its acknowledgment
     packet_end_command = construct_packet_end_command()
-    await glass.send(packet_end_command)
-    # Wait for acknowledgment (implement according to your protocol)
-    await asyncio.sleep(0.00001)
+    if is_failure_reply(await glass.request(packet_end_command, timeout=ack_timeout)):
+        return False
     # Send CRC check command
     crc_check_command = construct_crc_check_command(full_image_array)
-    await glass.send(crc_check_command)
\ No newline at end of file
+    return await glass.send(crc_check_command)
@@ -2,6 +2,7 @@ import asyncio
 import argparse
 import logging
 from even_glasses.bluetooth_manager import GlassesManager
+from even_glasses.registry import DeviceRegistry
 from even_glasses.commands import send_text, send_rsvp, send_notification, send_image
 from even_glasses.models import RSVPConfig, NCSNotification
 from even_glasses.notification_handlers import handle_incoming_notification
@@ -95,7 +96,7 @@ async def main():
         words_per_group=args.words_per_group, wpm=args.wpm, padding_char="..."
     )
 
-    manager = GlassesManager(left_address=None, right_address=None)
+    manager = GlassesManager(left_address=None, right_address=None, registry=DeviceRegistry())
     connected = await manager.scan_and_connect()
 
     if connected:
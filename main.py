@@ -1,6 +1,7 @@
 import asyncio
 import flet as ft
 from even_glasses.bluetooth_manager import GlassesManager
+from even_glasses.registry import DeviceRegistry
 from even_glasses.models import NCSNotification, RSVPConfig
 from even_glasses.notification_handlers import handle_incoming_notification
 import logging
@@ -28,7 +29,7 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Initialize GlassesManager
-manager = GlassesManager(left_address=None, right_address=None)
+manager = GlassesManager(left_address=None, right_address=None, registry=DeviceRegistry())
 
 DEBUG = False  # Toggle for debug features
 
@@ -522,6 +523,18 @@ End of demo text. Thank you for trying out the RSVP feature!"""
     ) = create_settings_section()
 
     # Update Status Function
+    def link_summary(glass) -> str:
+        """Median write time, acknowledgment round trip and throughput of an arm."""
+        metrics = glass.metrics_snapshot()
+        send = metrics["send"]["all"]
+        parts = []
+        if send["write"]["p50"] is not None:
+            parts.append(f"write {send['write']['p50'] * 1000:.1f} ms")
+        if send["ack_rtt"]["p50"] is not None:
+            parts.append(f"ack {send['ack_rtt']['p50'] * 1000:.1f} ms")
+        parts.append(f"{metrics['throughput']['bytes_per_second'] / 1024:.1f} KiB/s")
+        return ", ".join(parts)
+
     def on_status_changed():
         nonlocal connected
         left_glass = manager.left_glass
@@ -530,28 +543,32 @@ End of demo text. Thank you for trying out the RSVP feature!"""
         previous_connected = connected
 
         # Update left glass status
-        if left_glass and left_glass.client.is_connected:
+        if left_glass and left_glass.is_connected:
             left_status_icon.name = ft.icons.RADIO_BUTTON_CHECKED
             left_status_icon.color = ft.colors.GREEN
-            left_status_text.value = f"Left Glass ({left_glass.name[:13]}): Connected"
+            left_status_text.value = (
+                f"Left Glass ({left_glass.name[:13]}): Connected ({link_summary(left_glass)})"
+            )
         else:
             left_status_icon.name = ft.icons.RADIO_BUTTON_UNCHECKED
             left_status_icon.color = ft.colors.RED
             left_status_text.value = "Left Glass: Disconnected"
 
         # Update right glass status
-        if right_glass and right_glass.client.is_connected:
+        if right_glass and right_glass.is_connected:
             right_status_icon.name = ft.icons.RADIO_BUTTON_CHECKED
             right_status_icon.color = ft.colors.GREEN
-            right_status_text.value = f"Right Glass ({right_glass.name[:13]}): Connected"
+            right_status_text.value = (
+                f"Right Glass ({right_glass.name[:13]}): Connected ({link_summary(right_glass)})"
+            )
         else:
             right_status_icon.name = ft.icons.RADIO_BUTTON_UNCHECKED
             right_status_icon.color = ft.colors.RED
             right_status_text.value = "Right Glass: Disconnected"
 
         # Determine overall connection status
-        connected = (left_glass and left_glass.client.is_connected) or (
-            right_glass and right_glass.client.is_connected
+        connected = (left_glass and left_glass.is_connected) or (
+            right_glass and right_glass.is_connected
         )
 
         if connected != previous_connected:
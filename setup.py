@@ -14,8 +14,6 @@ setup(
     install_requires=[
         'bleak>=0.22.3',  
         'pydantic>=2.9.2',
-        'numpy>=1.26.4',
-        'numba>=0.60.0',
     ],
     classifiers=[
         'Programming Language :: Python :: 3',
@@ -0,0 +1,30 @@
+import asyncio
+
+from even_glasses.bluetooth_manager import Glass
+from even_glasses.models import Command
+from even_glasses.transport import LoopbackTransport
+
+
+def test_disconnect_while_heartbeat_echo_in_flight():
+    async def scenario():
+        # Silent arm, so the test decides when the echo arrives
+        glass = Glass("G1 Left", "left", "left", transport=LoopbackTransport(responder=None))
+        await glass.connect()
+        sent = glass.transport.received
+        while not any(packet[0] == Command.HEARTBEAT for packet in sent):
+            await asyncio.sleep(0)
+        heartbeat = next(packet for packet in sent if packet[0] == Command.HEARTBEAT)
+        # Let the heartbeat settle into waiting for its echo
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+        # The echo and the cancel land in the same loop iteration
+        glass._resolve_pending_reply(heartbeat)
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+        await glass.disconnect()
+        assert loop.time() - started_at < glass.heartbeat_freq
+        assert glass.heartbeat_task.done()
+        assert not glass.is_connected
+
+    asyncio.run(scenario())
@@ -0,0 +1,31 @@
+import asyncio
+
+from even_glasses import notification_handlers
+from even_glasses.models import Command
+
+
+def test_handler_assigned_into_command_handlers_is_dispatched():
+    received = []
+
+    async def handler(glass, sender, packet):
+        received.append((packet[1], bytes(packet[2:])))
+
+    previous = notification_handlers.COMMAND_HANDLERS[Command.QUICK_NOTE]
+    notification_handlers.COMMAND_HANDLERS[Command.QUICK_NOTE] = handler
+    try:
+        asyncio.run(
+            notification_handlers.handle_incoming_notification(None, 0, bytearray(b"\x21\x01ab"))
+        )
+    finally:
+        notification_handlers.COMMAND_HANDLERS[Command.QUICK_NOTE] = previous
+    assert received == [(1, b"ab")]
+    assert notification_handlers.HANDLER_TABLE[Command.QUICK_NOTE] is previous
+
+
+def test_removed_handler_is_not_dispatched():
+    previous = notification_handlers.COMMAND_HANDLERS.pop(Command.QUICK_NOTE)
+    try:
+        assert notification_handlers.HANDLER_TABLE[Command.QUICK_NOTE] is None
+    finally:
+        notification_handlers.register_handler(Command.QUICK_NOTE, previous)
+    assert notification_handlers.HANDLER_TABLE[Command.QUICK_NOTE] is previous
@@ -0,0 +1,39 @@
+import asyncio
+
+from even_glasses.bluetooth_manager import GlassesManager
+from even_glasses.codec import encode_notification_chunks
+from even_glasses.commands import send_notification_chunks
+from even_glasses.transport import LoopbackTransport
+
+
+def test_multi_chunk_notification_is_sent_in_one_batch():
+    async def scenario():
+        manager = GlassesManager(
+            left_address="left",
+            right_address="right",
+            transport_factory=lambda address: LoopbackTransport(address),
+        )
+        batches = []
+        for glass in (manager.left_glass, manager.right_glass):
+            await glass.connect()
+            send_many = glass.send_many
+
+            async def recording_send_many(packets, *args, _glass=glass, _send_many=send_many, **kwargs):
+                packets = list(packets)
+                batches.append((_glass.side, len(packets)))
+                return await _send_many(packets, *args, **kwargs)
+
+            glass.send_many = recording_send_many
+
+        chunks = encode_notification_chunks(b"x" * 600, 176, notify_id=1)
+        assert len(chunks) > 1
+        try:
+            assert await send_notification_chunks(manager, chunks)
+        finally:
+            await manager.disconnect_all()
+
+        assert batches == [("left", len(chunks)), ("right", len(chunks))]
+        for glass in (manager.left_glass, manager.right_glass):
+            assert [packet for packet in glass.transport.received if packet[0] == chunks[0][0]] == chunks
+
+    asyncio.run(scenario())